@@ -1,362 +1,726 @@
-"""
-Bosch FMCG Pricing API - Testing Script
-Comprehensive API testing with visual output
-"""
-
-import requests
-import json
-from datetime import datetime
-from typing import Dict, Any
-
-class BoschAPITester:
-    """Test suite for Bosch Pricing API"""
-    
-    def __init__(self, base_url: str):
-        """
-        Initialize the API tester
-        
-        Args:
-            base_url: Base URL of the API (e.g., https://your-app.onrender.com)
-        """
-        self.base_url = base_url.rstrip('/')
-        self.test_results = []
-    
-    def print_header(self, text: str):
-        """Print formatted header"""
-        print("\n" + "="*70)
-        print(f"  {text}")
-        print("="*70)
-    
-    def print_test(self, test_name: str):
-        """Print test name"""
-        print(f"\n[TEST] {test_name}")
-        print("-" * 70)
-    
-    def print_result(self, success: bool, message: str):
-        """Print test result"""
-        status = "[PASS]" if success else "[FAIL]"
-        print(f"{status} {message}")
-    
-    def test_health_check(self) -> bool:
-        """Test the health check endpoint"""
-        self.print_test("Health Check - GET /health")
-        
-        try:
-            response = requests.get(f"{self.base_url}/health", timeout=10)
-            
-            if response.status_code == 200:
-                data = response.json()
-                print(json.dumps(data, indent=2))
-                self.print_result(True, "Health check passed")
-                return True
-            else:
-                self.print_result(False, f"Status code: {response.status_code}")
-                return False
-                
-        except Exception as e:
-            self.print_result(False, f"Error: {str(e)}")
-            return False
-    
-    def test_api_info(self) -> bool:
-        """Test the API information endpoint"""
-        self.print_test("API Information - GET /")
-        
-        try:
-            response = requests.get(f"{self.base_url}/", timeout=10)
-            
-            if response.status_code == 200:
-                data = response.json()
-                print(json.dumps(data, indent=2))
-                self.print_result(True, "API info retrieved successfully")
-                return True
-            else:
-                self.print_result(False, f"Status code: {response.status_code}")
-                return False
-                
-        except Exception as e:
-            self.print_result(False, f"Error: {str(e)}")
-            return False
-    
-    def test_model_info(self) -> bool:
-        """Test the model information endpoint"""
-        self.print_test("Model Information - GET /info")
-        
-        try:
-            response = requests.get(f"{self.base_url}/info", timeout=10)
-            
-            if response.status_code == 200:
-                data = response.json()
-                print(json.dumps(data, indent=2))
-                self.print_result(True, "Model info retrieved successfully")
-                return True
-            else:
-                self.print_result(False, f"Status code: {response.status_code}")
-                return False
-                
-        except Exception as e:
-            self.print_result(False, f"Error: {str(e)}")
-            return False
-    
-    def test_single_prediction(self, test_data: Dict[str, Any], test_name: str) -> bool:
-        """Test single prediction endpoint"""
-        self.print_test(f"Single Prediction - {test_name}")
-        
-        print("Input Data:")
-        print(json.dumps(test_data, indent=2))
-        
-        try:
-            response = requests.post(
-                f"{self.base_url}/predict",
-                headers={"Content-Type": "application/json"},
-                json=test_data,
-                timeout=10
-            )
-            
-            print(f"\nResponse Status: {response.status_code}")
-            data = response.json()
-            print("\nResponse Data:")
-            print(json.dumps(data, indent=2))
-            
-            if response.status_code == 200 and data.get('status') == 'success':
-                predicted_demand = data.get('predicted_demand')
-                self.print_result(True, f"Prediction successful: {predicted_demand} units")
-                return True
-            else:
-                self.print_result(False, f"Prediction failed: {data.get('error', 'Unknown error')}")
-                return False
-                
-        except Exception as e:
-            self.print_result(False, f"Error: {str(e)}")
-            return False
-    
-    def test_batch_prediction(self) -> bool:
-        """Test batch prediction endpoint"""
-        self.print_test("Batch Prediction - Multiple Scenarios")
-        
-        batch_data = {
-            "scenarios": [
-                {
-                    "price": 10.00,
-                    "promotion": 0,
-                    "competitor_price": 10.50,
-                    "day_of_week": 1,
-                    "month": 1,
-                    "inventory_level": 500
-                },
-                {
-                    "price": 9.00,
-                    "promotion": 1,
-                    "competitor_price": 10.50,
-                    "day_of_week": 6,
-                    "month": 6,
-                    "inventory_level": 750
-                },
-                {
-                    "price": 12.00,
-                    "promotion": 0,
-                    "competitor_price": 11.00,
-                    "day_of_week": 3,
-                    "month": 12,
-                    "inventory_level": 400
-                }
-            ]
-        }
-        
-        print("Input Data:")
-        print(json.dumps(batch_data, indent=2))
-        
-        try:
-            response = requests.post(
-                f"{self.base_url}/batch-predict",
-                headers={"Content-Type": "application/json"},
-                json=batch_data,
-                timeout=10
-            )
-            
-            print(f"\nResponse Status: {response.status_code}")
-            data = response.json()
-            print("\nResponse Data:")
-            print(json.dumps(data, indent=2))
-            
-            if response.status_code == 200 and data.get('status') == 'success':
-                successful = data.get('successful', 0)
-                total = data.get('total_scenarios', 0)
-                self.print_result(True, f"Batch prediction successful: {successful}/{total} scenarios")
-                return True
-            else:
-                self.print_result(False, f"Batch prediction failed")
-                return False
-                
-        except Exception as e:
-            self.print_result(False, f"Error: {str(e)}")
-            return False
-    
-    def test_error_handling(self) -> bool:
-        """Test error handling with invalid data"""
-        self.print_test("Error Handling - Invalid Data")
-        
-        invalid_data = {
-            "price": 10.00
-            # Missing required fields
-        }
-        
-        print("Input Data (Missing Fields):")
-        print(json.dumps(invalid_data, indent=2))
-        
-        try:
-            response = requests.post(
-                f"{self.base_url}/predict",
-                headers={"Content-Type": "application/json"},
-                json=invalid_data,
-                timeout=10
-            )
-            
-            print(f"\nResponse Status: {response.status_code}")
-            data = response.json()
-            print("\nResponse Data:")
-            print(json.dumps(data, indent=2))
-            
-            if response.status_code == 400 and data.get('status') == 'error':
-                self.print_result(True, "Error handling working correctly")
-                return True
-            else:
-                self.print_result(False, "Error handling not working as expected")
-                return False
-                
-        except Exception as e:
-            self.print_result(False, f"Error: {str(e)}")
-            return False
-    
-    def run_all_tests(self):
-        """Run all API tests"""
-        self.print_header("Bosch FMCG Pricing API - Comprehensive Testing")
-        
-        print(f"\nAPI Base URL: {self.base_url}")
-        print(f"Test Started: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        
-        # Test scenarios
-        test_scenarios = [
-            {
-                "name": "Standard Pricing (No Promotion)",
-                "data": {
-                    "price": 10.50,
-                    "promotion": 0,
-                    "competitor_price": 11.00,
-                    "day_of_week": 3,
-                    "month": 6,
-                    "inventory_level": 500
-                }
-            },
-            {
-                "name": "Promotion Active + Weekend",
-                "data": {
-                    "price": 9.00,
-                    "promotion": 1,
-                    "competitor_price": 10.50,
-                    "day_of_week": 6,
-                    "month": 12,
-                    "inventory_level": 800
-                }
-            },
-            {
-                "name": "High Price (Low Demand Expected)",
-                "data": {
-                    "price": 15.00,
-                    "promotion": 0,
-                    "competitor_price": 12.00,
-                    "day_of_week": 2,
-                    "month": 3,
-                    "inventory_level": 300
-                }
-            },
-            {
-                "name": "Competitive Pricing",
-                "data": {
-                    "price": 8.50,
-                    "promotion": 1,
-                    "competitor_price": 11.00,
-                    "day_of_week": 7,
-                    "month": 6,
-                    "inventory_level": 1000
-                }
-            }
-        ]
-        
-        # Run tests
-        results = []
-        
-        # Basic endpoint tests
-        results.append(("Health Check", self.test_health_check()))
-        results.append(("API Information", self.test_api_info()))
-        results.append(("Model Information", self.test_model_info()))
-        
-        # Prediction tests
-        for scenario in test_scenarios:
-            success = self.test_single_prediction(scenario["data"], scenario["name"])
-            results.append((f"Prediction: {scenario['name']}", success))
-        
-        # Batch prediction test
-        results.append(("Batch Prediction", self.test_batch_prediction()))
-        
-        # Error handling test
-        results.append(("Error Handling", self.test_error_handling()))
-        
-        # Summary
-        self.print_header("Test Summary")
-        
-        total_tests = len(results)
-        passed_tests = sum(1 for _, success in results if success)
-        failed_tests = total_tests - passed_tests
-        
-        print(f"\nTotal Tests: {total_tests}")
-        print(f"Passed: {passed_tests}")
-        print(f"Failed: {failed_tests}")
-        print(f"Success Rate: {(passed_tests/total_tests)*100:.1f}%")
-        
-        print("\nDetailed Results:")
-        for test_name, success in results:
-            status = "[PASS]" if success else "[FAIL]"
-            print(f"  {status} {test_name}")
-        
-        print("\n" + "="*70)
-        print(f"Test Completed: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        print("="*70 + "\n")
-        
-        return passed_tests == total_tests
-
-
-def main():
-    """Main function to run tests"""
-    print("Bosch FMCG Pricing API - Testing Tool")
-    print("="*70)
-    
-    # Get API URL from user
-    print("\nEnter your API URL:")
-    print("  For Render: https://your-app-name.onrender.com")
-    print("  For local: http://127.0.0.1:5000")
-    
-    api_url = input("\nAPI URL: ").strip()
-    
-    if not api_url:
-        print("\nNo URL provided. Using default local URL...")
-        api_url = "http://127.0.0.1:5000"
-    
-    # Create tester and run tests
-    tester = BoschAPITester(api_url)
-    
-    try:
-        all_passed = tester.run_all_tests()
-        
-        if all_passed:
-            print("\n[SUCCESS] All tests passed! Your API is working perfectly.")
-        else:
-            print("\n[WARNING] Some tests failed. Please check the details above.")
-    
-    except KeyboardInterrupt:
-        print("\n\nTesting interrupted by user.")
-    except Exception as e:
-        print(f"\n\n[ERROR] Testing failed: {str(e)}")
-
-
-if __name__ == "__main__":
+"""
+Bosch FMCG Pricing API - Testing Script
+Comprehensive API testing with visual output
+"""
+
+import os
+import sys
+import requests
+import orjson
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from functools import partial
+from typing import Dict, Any, Optional
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import msgpack
+except ImportError:  # Optional: only needed for the MessagePack transport
+    msgpack = None
+
+try:
+    import httpx
+except ImportError:  # Optional: only needed for the HTTP/2 client
+    httpx = None
+
+try:
+    import brotli  # noqa: F401 - lets urllib3/httpx decode "br" responses
+    ACCEPT_ENCODING = "br, gzip, deflate"
+except ImportError:
+    ACCEPT_ENCODING = "gzip, deflate"
+
+MSGPACK_MIMETYPE = "application/msgpack"
+
+
+# Test scenarios
+TEST_SCENARIOS = [
+    {
+        "name": "Standard Pricing (No Promotion)",
+        "data": {
+            "price": 10.50,
+            "promotion": 0,
+            "competitor_price": 11.00,
+            "day_of_week": 3,
+            "month": 6,
+            "inventory_level": 500
+        }
+    },
+    {
+        "name": "Promotion Active + Weekend",
+        "data": {
+            "price": 9.00,
+            "promotion": 1,
+            "competitor_price": 10.50,
+            "day_of_week": 6,
+            "month": 12,
+            "inventory_level": 800
+        }
+    },
+    {
+        "name": "High Price (Low Demand Expected)",
+        "data": {
+            "price": 15.00,
+            "promotion": 0,
+            "competitor_price": 12.00,
+            "day_of_week": 2,
+            "month": 3,
+            "inventory_level": 300
+        }
+    },
+    {
+        "name": "Competitive Pricing",
+        "data": {
+            "price": 8.50,
+            "promotion": 1,
+            "competitor_price": 11.00,
+            "day_of_week": 7,
+            "month": 6,
+            "inventory_level": 1000
+        }
+    }
+]
+
+# Batch prediction scenarios
+BATCH_DATA = {
+    "scenarios": [
+        {
+            "price": 10.00,
+            "promotion": 0,
+            "competitor_price": 10.50,
+            "day_of_week": 1,
+            "month": 1,
+            "inventory_level": 500
+        },
+        {
+            "price": 9.00,
+            "promotion": 1,
+            "competitor_price": 10.50,
+            "day_of_week": 6,
+            "month": 6,
+            "inventory_level": 750
+        },
+        {
+            "price": 12.00,
+            "promotion": 0,
+            "competitor_price": 11.00,
+            "day_of_week": 3,
+            "month": 12,
+            "inventory_level": 400
+        }
+    ]
+}
+
+# Invalid payload used for error handling (missing required fields)
+INVALID_DATA = {
+    "price": 10.00
+}
+
+# Price so large that its prediction would overflow to infinity
+OUT_OF_RANGE_DATA = {
+    "price": -1e308,
+    "promotion": 0,
+    "competitor_price": 10.0,
+    "day_of_week": 3,
+    "month": 6,
+    "inventory_level": 500
+}
+
+# Scenario with prices off the cent grid, scored both through and around the prediction cache
+OFF_CENT_DATA = {
+    "price": 10.004,
+    "promotion": 0,
+    "competitor_price": 10.0,
+    "day_of_week": 3,
+    "month": 6,
+    "inventory_level": 500
+}
+
+# Feature row (in the server's FEATURE_ORDER) scored alone and in batches on
+# both sides of the server's 512-row switch to its parallel kernel
+PINNED_ROW = [14.57, 1, 6.49, 4, 12, 500]
+PINNED_BATCH_SIZES = (1, 511, 512)
+
+# Request bodies are serialized once at import and reused on every run
+SCENARIO_PAYLOADS = [(s["name"], orjson.dumps(s["data"])) for s in TEST_SCENARIOS]
+BATCH_PAYLOAD = orjson.dumps(BATCH_DATA)
+INVALID_PAYLOAD = orjson.dumps(INVALID_DATA)
+OUT_OF_RANGE_PAYLOAD = orjson.dumps(OUT_OF_RANGE_DATA)
+OFF_CENT_PAYLOAD = orjson.dumps(OFF_CENT_DATA)
+OFF_CENT_LIST_PAYLOAD = orjson.dumps([OFF_CENT_DATA])
+PINNED_PAYLOAD = orjson.dumps(dict(zip(
+    ("price", "promotion", "competitor_price", "day_of_week", "month", "inventory_level"),
+    PINNED_ROW)))
+PINNED_BATCH_PAYLOADS = [(n, orjson.dumps({"features": [PINNED_ROW] * n}))
+                         for n in PINNED_BATCH_SIZES]
+
+# Validators for the static endpoints, reused across runs via If-None-Match
+ETAG_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "bosch_api_tester.json")
+
+# Chunk size used when streaming large responses
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Pretty-printed bodies larger than this are shown as a head/tail slice
+MAX_DUMP_BYTES = 4096
+
+class BoschAPITester:
+    """Test suite for Bosch Pricing API"""
+    
+    def __init__(self, base_url: str, use_msgpack: bool = False, verbose: bool = False,
+                 use_http2: bool = False):
+        """
+        Initialize the API tester
+        
+        Args:
+            base_url: Base URL of the API (e.g., https://your-app.onrender.com)
+            use_msgpack: Send and receive batch payloads as MessagePack instead of JSON
+            verbose: Pretty-print request and response bodies
+            use_http2: Multiplex all requests over one HTTP/2 connection using httpx
+        """
+        if use_msgpack and msgpack is None:
+            raise ImportError("use_msgpack=True requires the 'msgpack' package")
+        if use_http2 and httpx is None:
+            raise ImportError("use_http2=True requires the 'httpx[http2]' package")
+        
+        self.base_url = base_url.rstrip('/')
+        self.test_results = []
+        self.use_msgpack = use_msgpack
+        self.verbose = verbose
+        
+        # Tests run concurrently; each buffers its output and flushes it under the lock
+        self._print_lock = threading.Lock()
+        self._output = threading.local()
+        
+        # On-disk ETag/Last-Modified cache for the static endpoints
+        self._cache_lock = threading.Lock()
+        self._cache_dirty = False
+        self._etag_cache = self._load_etag_cache()
+        
+        # Exactly one HTTP client is live: httpx for HTTP/2, otherwise requests
+        self.session = None
+        self._http = None
+        
+        if use_http2:
+            self._http = httpx.Client(
+                http2=True,
+                base_url=self.base_url,
+                timeout=10.0,
+                headers={"Content-Type": "application/json", "Accept-Encoding": ACCEPT_ENCODING},
+                limits=httpx.Limits(max_connections=8, max_keepalive_connections=8)
+            )
+        else:
+            # Reuse one keep-alive connection pool across all tests
+            self.session = requests.Session()
+            self.session.headers.update({
+                "Content-Type": "application/json",
+                "Connection": "keep-alive",
+                "Accept-Encoding": ACCEPT_ENCODING
+            })
+            adapter = HTTPAdapter(
+                pool_connections=4,
+                pool_maxsize=16,
+                max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=[502, 503, 504])
+            )
+            self.session.mount("http://", adapter)
+            self.session.mount("https://", adapter)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def close(self):
+        """Persist the ETag cache and close the underlying HTTP client"""
+        self._save_etag_cache()
+        if self._http is not None:
+            self._http.close()
+        if self.session is not None:
+            self.session.close()
+    
+    def _get(self, path: str, headers: Optional[Dict[str, str]] = None):
+        """Send a GET request to the API with the active client"""
+        if self._http is not None:
+            return self._http.get(path, headers=headers)
+        return self.session.get(f"{self.base_url}{path}", headers=headers, timeout=10)
+    
+    def _post_streamed(self, path: str, body: bytes, headers: Optional[Dict[str, str]] = None):
+        """
+        POST and read the response body incrementally in 64 KiB chunks
+        
+        Large batch replies are accumulated into one buffer as they arrive
+        instead of being held by the client and copied again on access.
+        Returns the response and the raw body buffer.
+        """
+        buf = bytearray()
+        if self._http is not None:
+            with self._http.stream("POST", path, content=body, headers=headers) as response:
+                for chunk in response.iter_bytes(STREAM_CHUNK_SIZE):
+                    buf += chunk
+        else:
+            response = self.session.post(f"{self.base_url}{path}", data=body, headers=headers,
+                                         timeout=10, stream=True)
+            with response:
+                for chunk in response.iter_content(chunk_size=STREAM_CHUNK_SIZE):
+                    buf += chunk
+        return response, buf
+    
+    def _get_cached(self, path: str):
+        """
+        GET a mostly static endpoint, revalidating against the ETag cache
+        
+        Returns the response and the decoded body; a 304 Not Modified
+        reuses the body cached from a previous run.
+        """
+        url = f"{self.base_url}{path}"
+        entry = self._etag_cache.get(url)
+        
+        headers = {}
+        if entry:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+        
+        response = self._get(path, headers=headers)
+        
+        if response.status_code == 304 and entry:
+            return response, entry["body"]
+        if response.status_code != 200:
+            return response, None
+        
+        data = orjson.loads(response.content)
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if etag or last_modified:
+            with self._cache_lock:
+                self._etag_cache[url] = {
+                    "etag": etag,
+                    "last_modified": last_modified,
+                    "body": data
+                }
+                self._cache_dirty = True
+        return response, data
+    
+    def _load_etag_cache(self) -> Dict[str, Any]:
+        """Load cached validators and bodies from disk"""
+        try:
+            with open(ETAG_CACHE_PATH, "rb") as f:
+                return orjson.loads(f.read())
+        except (OSError, orjson.JSONDecodeError):
+            return {}
+    
+    def _save_etag_cache(self):
+        """Write the ETag cache back to disk if it changed"""
+        if not self._cache_dirty:
+            return
+        try:
+            os.makedirs(os.path.dirname(ETAG_CACHE_PATH), exist_ok=True)
+            with open(ETAG_CACHE_PATH, "wb") as f:
+                f.write(orjson.dumps(self._etag_cache))
+            self._cache_dirty = False
+        except OSError:
+            pass
+    
+    def _warm_up(self):
+        """Prime DNS, the TCP/TLS connection and the session ticket with a throwaway HEAD"""
+        try:
+            if self._http is not None:
+                self._http.head("/", timeout=5)
+            else:
+                self.session.head(self.base_url, timeout=5)
+        except Exception:
+            pass
+    
+    def _post(self, path: str, body: bytes, headers: Optional[Dict[str, str]] = None):
+        """Send a POST request with a pre-serialized body using the active client"""
+        if self._http is not None:
+            return self._http.post(path, content=body, headers=headers)
+        return self.session.post(f"{self.base_url}{path}", data=body, headers=headers, timeout=10)
+    
+    def print_header(self, text: str):
+        """Print formatted header"""
+        print("\n" + "="*70)
+        print(f"  {text}")
+        print("="*70)
+    
+    def _print(self, *args):
+        """Print, or buffer the line when running inside a concurrent test"""
+        lines = getattr(self._output, 'lines', None)
+        if lines is None:
+            print(*args)
+        else:
+            lines.append(" ".join(str(arg) for arg in args))
+    
+    def _dump(self, data: Any, title: Optional[str] = None):
+        """Pretty-print a JSON body in verbose mode, truncating large payloads"""
+        if not self.verbose:
+            return
+        
+        body = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        if len(body) > MAX_DUMP_BYTES:
+            body = body[:2048] + b"\n...[truncated]...\n" + body[-1024:]
+        
+        if title:
+            self._print(title)
+        self._print(body.decode(errors="replace"))
+    
+    def _run_test(self, test_fn) -> bool:
+        """Run one test with its output buffered, then flush it as a single block"""
+        self._output.lines = []
+        try:
+            return test_fn()
+        finally:
+            lines, self._output.lines = self._output.lines, None
+            with self._print_lock:
+                print("\n".join(lines))
+    
+    def print_test(self, test_name: str):
+        """Print test name"""
+        self._print(f"\n[TEST] {test_name}")
+        self._print("-" * 70)
+    
+    def print_result(self, success: bool, message: str):
+        """Print test result"""
+        status = "[PASS]" if success else "[FAIL]"
+        self._print(f"{status} {message}")
+    
+    def test_health_check(self) -> bool:
+        """Test the health check endpoint"""
+        self.print_test("Health Check - GET /health")
+        
+        try:
+            response, data = self._get_cached("/health")
+            
+            if data is not None:
+                self._dump(data)
+                self.print_result(True, "Health check passed")
+                return True
+            else:
+                self.print_result(False, f"Status code: {response.status_code}")
+                return False
+                
+        except Exception as e:
+            self.print_result(False, f"Error: {str(e)}")
+            return False
+    
+    def test_api_info(self) -> bool:
+        """Test the API information endpoint"""
+        self.print_test("API Information - GET /api")
+        
+        try:
+            response, data = self._get_cached("/api")
+            
+            if data is not None:
+                self._dump(data)
+                self.print_result(True, "API info retrieved successfully")
+                return True
+            else:
+                self.print_result(False, f"Status code: {response.status_code}")
+                return False
+                
+        except Exception as e:
+            self.print_result(False, f"Error: {str(e)}")
+            return False
+    
+    def test_model_info(self) -> bool:
+        """Test the model information endpoint"""
+        self.print_test("Model Information - GET /info")
+        
+        try:
+            response, data = self._get_cached("/info")
+            
+            if data is not None:
+                self._dump(data)
+                self.print_result(True, "Model info retrieved successfully")
+                return True
+            else:
+                self.print_result(False, f"Status code: {response.status_code}")
+                return False
+                
+        except Exception as e:
+            self.print_result(False, f"Error: {str(e)}")
+            return False
+    
+    def test_single_prediction(self, test_data: Dict[str, Any], test_name: str,
+                               payload: Optional[bytes] = None) -> bool:
+        """Test single prediction endpoint (payload: pre-serialized test_data)"""
+        self.print_test(f"Single Prediction - {test_name}")
+        
+        self._dump(test_data, "Input Data:")
+        
+        try:
+            body = payload if payload is not None else orjson.dumps(test_data)
+            response = self._post("/predict", body)
+            
+            self._print(f"\nResponse Status: {response.status_code}")
+            data = orjson.loads(response.content)
+            self._dump(data, "\nResponse Data:")
+            
+            if response.status_code == 200 and data.get('status') == 'success':
+                predicted_demand = data.get('predicted_demand')
+                self.print_result(True, f"Prediction successful: {predicted_demand} units")
+                return True
+            else:
+                self.print_result(False, f"Prediction failed: {data.get('error', 'Unknown error')}")
+                return False
+                
+        except Exception as e:
+            self.print_result(False, f"Error: {str(e)}")
+            return False
+    
+    def test_batch_prediction(self) -> bool:
+        """Test batch prediction endpoint"""
+        self.print_test("Batch Prediction - Multiple Scenarios")
+        
+        self._dump(BATCH_DATA, "Input Data:")
+        
+        try:
+            if self.use_msgpack:
+                response, content = self._post_streamed(
+                    "/batch-predict",
+                    msgpack.packb(BATCH_DATA, use_bin_type=True),
+                    headers={"Content-Type": MSGPACK_MIMETYPE, "Accept": MSGPACK_MIMETYPE}
+                )
+            else:
+                response, content = self._post_streamed("/batch-predict", BATCH_PAYLOAD)
+            
+            self._print(f"\nResponse Status: {response.status_code}")
+            self._print(f"Received {len(content):,} bytes")
+            if response.headers.get("Content-Type", "").startswith(MSGPACK_MIMETYPE):
+                data = msgpack.unpackb(content, raw=False)
+            else:
+                data = orjson.loads(content)
+            self._dump(data, "\nResponse Data:")
+            
+            if response.status_code == 200 and data.get('status') == 'success':
+                successful = data.get('successful', 0)
+                total = data.get('total_scenarios', 0)
+                self.print_result(True, f"Batch prediction successful: {successful}/{total} scenarios")
+                return True
+            else:
+                self.print_result(False, f"Batch prediction failed")
+                return False
+                
+        except Exception as e:
+            self.print_result(False, f"Error: {str(e)}")
+            return False
+    
+    def test_error_handling(self) -> bool:
+        """Test error handling with invalid data"""
+        self.print_test("Error Handling - Invalid Data")
+        
+        self._dump(INVALID_DATA, "Input Data (Missing Fields):")
+        
+        try:
+            response = self._post("/predict", INVALID_PAYLOAD)
+            
+            self._print(f"\nResponse Status: {response.status_code}")
+            data = orjson.loads(response.content)
+            self._dump(data, "\nResponse Data:")
+            
+            if response.status_code == 400 and data.get('status') == 'error':
+                self.print_result(True, "Error handling working correctly")
+                return True
+            else:
+                self.print_result(False, "Error handling not working as expected")
+                return False
+                
+        except Exception as e:
+            self.print_result(False, f"Error: {str(e)}")
+            return False
+    
+    def test_out_of_range_input(self) -> bool:
+        """Test that an input whose prediction can't be finite is a 400, not a 500"""
+        self.print_test("Error Handling - Out-of-Range Price")
+        
+        self._dump(OUT_OF_RANGE_DATA, "Input Data:")
+        
+        try:
+            response = self._post("/predict", OUT_OF_RANGE_PAYLOAD)
+            
+            self._print(f"\nResponse Status: {response.status_code}")
+            data = orjson.loads(response.content)
+            self._dump(data, "\nResponse Data:")
+            
+            if response.status_code == 400 and data.get('status') == 'error':
+                self.print_result(True, f"Rejected: {data.get('error')}")
+                return True
+            else:
+                self.print_result(False, "Out-of-range input not rejected with a 400")
+                return False
+                
+        except Exception as e:
+            self.print_result(False, f"Error: {str(e)}")
+            return False
+    
+    def test_cache_consistency(self) -> bool:
+        """
+        Test that cached and uncached /predict answers are identical
+        
+        Scores OFF_CENT_DATA on an emptied cache (miss), again (hit) and as a
+        one-record list, which never goes through the cache. Assumes the
+        server's default noise-free predictions.
+        """
+        self.print_test("Prediction Cache - Cached vs Uncached /predict")
+        
+        self._dump(OFF_CENT_DATA, "Input Data:")
+        
+        try:
+            self._post("/cache/clear", b"")
+            miss = self._post("/predict", OFF_CENT_PAYLOAD)
+            hit = self._post("/predict", OFF_CENT_PAYLOAD)
+            uncached = self._post("/predict", OFF_CENT_LIST_PAYLOAD)
+            
+            responses = (miss, hit, uncached)
+            self._print(f"\nResponse Status: {', '.join(str(r.status_code) for r in responses)}")
+            if any(r.status_code != 200 for r in responses):
+                self.print_result(False, "Prediction failed")
+                return False
+            
+            values = [orjson.loads(miss.content).get('predicted_demand'),
+                      orjson.loads(hit.content).get('predicted_demand'),
+                      orjson.loads(uncached.content)['predictions'][0].get('predicted_demand')]
+            self._print(f"Miss / hit / uncached: {values}")
+            
+            if len(set(values)) == 1:
+                self.print_result(True, f"Cache returns the uncached value: {values[0]} units")
+                return True
+            else:
+                self.print_result(False, f"Cached and uncached predictions differ: {values}")
+                return False
+                
+        except Exception as e:
+            self.print_result(False, f"Error: {str(e)}")
+            return False
+    
+    def test_batch_size_consistency(self) -> bool:
+        """Test that a row scores the same alone on /predict and in /predict/batch batches of any size"""
+        self.print_test("Batch Consistency - One Row at Batch Sizes 1, 511, 512")
+        
+        try:
+            response = self._post("/predict", PINNED_PAYLOAD)
+            self._print(f"\nResponse Status: {response.status_code}")
+            if response.status_code != 200:
+                self.print_result(False, "Single prediction failed")
+                return False
+            expected = orjson.loads(response.content).get('predicted_demand')
+            self._print(f"/predict: {expected}")
+            
+            for size, payload in PINNED_BATCH_PAYLOADS:
+                response = self._post("/predict/batch", payload)
+                if response.status_code != 200:
+                    self.print_result(False, f"Batch of {size} failed: status {response.status_code}")
+                    return False
+                values = set(orjson.loads(response.content).get('predictions', []))
+                self._print(f"/predict/batch x{size}: {sorted(values)}")
+                if values != {expected}:
+                    self.print_result(False, f"Batch of {size} scored {sorted(values)}, expected {expected}")
+                    return False
+            
+            self.print_result(True, f"Row scored {expected} units at every batch size")
+            return True
+                
+        except Exception as e:
+            self.print_result(False, f"Error: {str(e)}")
+            return False
+    
+    def run_all_tests(self):
+        """Run all API tests"""
+        self.print_header("Bosch FMCG Pricing API - Comprehensive Testing")
+        
+        print(f"\nAPI Base URL: {self.base_url}")
+        print(f"Test Started: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        
+        # Pay the connection setup cost before the first real test
+        self._warm_up()
+        
+        
+        # Basic endpoint tests
+        jobs = [
+            ("Health Check", self.test_health_check),
+            ("API Information", self.test_api_info),
+            ("Model Information", self.test_model_info),
+        ]
+        
+        # Prediction tests
+        for scenario, (name, payload) in zip(TEST_SCENARIOS, SCENARIO_PAYLOADS):
+            jobs.append((f"Prediction: {name}",
+                         partial(self.test_single_prediction, scenario["data"], name, payload)))
+        
+        # Batch prediction and error handling tests
+        jobs.append(("Batch Prediction", self.test_batch_prediction))
+        jobs.append(("Error Handling", self.test_error_handling))
+        jobs.append(("Out-of-Range Input", self.test_out_of_range_input))
+        jobs.append(("Cache Consistency", self.test_cache_consistency))
+        jobs.append(("Batch Size Consistency", self.test_batch_size_consistency))
+        
+        # Tests are independent and latency bound, so run them concurrently;
+        # results are collected in submission order to keep the summary stable
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = [(name, executor.submit(self._run_test, fn)) for name, fn in jobs]
+            results = [(name, future.result()) for name, future in futures]
+        
+        # Summary
+        self.print_header("Test Summary")
+        
+        # Count and format the detailed results in a single pass
+        total_tests = len(results)
+        passed_tests = 0
+        detail_lines = []
+        for test_name, success in results:
+            passed_tests += success
+            detail_lines.append(f"  {'[PASS]' if success else '[FAIL]'} {test_name}")
+        failed_tests = total_tests - passed_tests
+        
+        sys.stdout.write(
+            f"\nTotal Tests: {total_tests}\n"
+            f"Passed: {passed_tests}\n"
+            f"Failed: {failed_tests}\n"
+            f"Success Rate: {(passed_tests/total_tests)*100:.1f}%\n"
+            "\nDetailed Results:\n" + "\n".join(detail_lines) + "\n"
+        )
+        
+        print("\n" + "="*70)
+        print(f"Test Completed: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        print("="*70 + "\n")
+        
+        return passed_tests == total_tests
+
+
+def main():
+    """Main function to run tests"""
+    print("Bosch FMCG Pricing API - Testing Tool")
+    print("="*70)
+    
+    # Get API URL from user
+    print("\nEnter your API URL:")
+    print("  For Render: https://your-app-name.onrender.com")
+    print("  For local: http://127.0.0.1:5000")
+    
+    api_url = input("\nAPI URL: ").strip()
+    
+    if not api_url:
+        print("\nNo URL provided. Using default local URL...")
+        api_url = "http://127.0.0.1:5000"
+    
+    # Create tester and run tests
+    try:
+        verbose = "-v" in sys.argv[1:] or "--verbose" in sys.argv[1:]
+        with BoschAPITester(api_url, verbose=verbose) as tester:
+            all_passed = tester.run_all_tests()
+        
+        if all_passed:
+            print("\n[SUCCESS] All tests passed! Your API is working perfectly.")
+        else:
+            print("\n[WARNING] Some tests failed. Please check the details above.")
+    
+    except KeyboardInterrupt:
+        print("\n\nTesting interrupted by user.")
+    except Exception as e:
+        print(f"\n\n[ERROR] Testing failed: {str(e)}")
+
+
+if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -35,6 +35,7 @@ print(df.head())
 # ===============================
 # Example feature and target columns
 X = df.drop("target", axis=1)   # Change "target" to your actual label column
+X = X.astype("float32")         # XGBoost works in float32; avoids a float64 copy and upcast
 y = df["target"]
 
 X_train, X_test, y_train, y_test = train_test_split(
@@ -66,6 +67,7 @@ xgb_model = xgb.XGBRegressor(
     max_depth=6,
     subsample=0.8,
     colsample_bytree=0.8,
+    n_jobs=-1,            # use every core for tree building and prediction
     random_state=42
 )
 
@@ -77,4 +79,13 @@ print("MAE:", mean_absolute_error(y_test, xgb_pred))
 print("MSE:", mean_squared_error(y_test, xgb_pred))
 print("R2:", r2_score(y_test, xgb_pred))
 
+# ===============================
+# SAVE MODEL
+# ===============================
+# Native XGBoost JSON format: a serving runtime can load it with
+# xgb.Booster().load_model() and needs neither pandas nor joblib
+model_path = "xgb_demand_model.json"
+xgb_model.save_model(model_path)
+print(f"\nXGBoost model saved to: {model_path}")
+
 
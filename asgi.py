@@ -0,0 +1,17 @@
+"""
+Bosch FMCG Pricing Model - ASGI Entrypoint
+Serves the Flask app from an ASGI server such as uvicorn
+
+Usage:
+    uvicorn asgi:app --workers 4
+"""
+
+import os
+
+from a2wsgi import WSGIMiddleware
+
+from mock_api_server import app as flask_app
+
+# The event loop accepts connections; Flask views run on a bounded thread pool
+# so a long /batch-predict holds one pool thread, not the whole worker
+app = WSGIMiddleware(flask_app, workers=int(os.getenv("ASGI_THREADS", "10")))
@@ -0,0 +1,50 @@
+"""
+Bosch FMCG Pricing Model - Gunicorn Configuration
+Production entrypoint for the API server
+
+Usage:
+    gunicorn wsgi:app
+"""
+
+import multiprocessing
+import os
+
+# Bind to the port provided by the platform (e.g. Render), default 5000
+bind = f"0.0.0.0:{os.getenv('PORT', '5000')}"
+
+# Scoring is cheap next to request handling, so the default is many
+# single-threaded sync workers; GUNICORN_THREADS > 1 switches to gthread
+workers = int(os.getenv("WEB_CONCURRENCY", 2 * multiprocessing.cpu_count() + 1))
+threads = int(os.getenv("GUNICORN_THREADS", "1"))
+worker_class = os.getenv("GUNICORN_WORKER_CLASS", "sync" if threads == 1 else "gthread")
+
+# Split the cores between the workers' native thread pools so workers x pool
+# size doesn't oversubscribe them (one thread each with the default worker
+# count). Numba's prange pool, which runs the batch kernel and which warm_up
+# starts in every worker, sizes itself from NUMBA_NUM_THREADS; OpenMP/BLAS
+# read OMP_NUM_THREADS. Both must be set before the app is preloaded
+pool_threads = str(max(1, multiprocessing.cpu_count() // workers))
+os.environ.setdefault("NUMBA_NUM_THREADS", pool_threads)
+os.environ.setdefault("OMP_NUM_THREADS", pool_threads)
+
+# Hold idle client connections open so repeat callers skip the TCP handshake
+# (honoured by gthread workers; sync workers close after each response)
+keepalive = int(os.getenv("GUNICORN_KEEPALIVE", "30"))
+
+# Import the app once in the master and fork workers from it (copy-on-write)
+preload_app = True
+
+# Pin each worker to its own CPU (Linux only) so it keeps its caches warm
+# and isn't migrated mid-request. Off by default: a pinned worker's Numba
+# batch kernel also runs on just that one core
+pin_workers = os.getenv("GUNICORN_PIN_WORKERS", "0") == "1"
+
+def post_fork(server, worker):
+    """Warm each worker's model state before it accepts requests"""
+    if pin_workers and hasattr(os, "sched_setaffinity"):
+        cpus = sorted(os.sched_getaffinity(0))
+        # worker.age counts spawns, so replacement workers rotate across CPUs
+        os.sched_setaffinity(0, {cpus[worker.age % len(cpus)]})
+    
+    from mock_api_server import warm_up
+    warm_up()
@@ -1,1029 +1,1344 @@
-"""
-Bosch FMCG Pricing Model - Mock API Server
-Simulates AWS API Gateway endpoint locally for testing
-"""
-
-from flask import Flask, request, jsonify
-import json
-from datetime import datetime
-import random
-
-app = Flask(__name__)
-
-# Simulated model prediction function
-def predict_demand(input_data):
-    """
-    Simulate demand prediction based on input features
-    """
-    try:
-        # Extract features
-        price = float(input_data.get('price', 10))
-        promotion = int(input_data.get('promotion', 0))
-        competitor_price = float(input_data.get('competitor_price', 10))
-        day_of_week = int(input_data.get('day_of_week', 1))
-        month = int(input_data.get('month', 1))
-        inventory_level = int(input_data.get('inventory_level', 500))
-        
-        # Simple demand prediction logic
-        base_demand = 1000
-        
-        # Price elasticity
-        price_factor = max(0, 1 - (price - 10) * 0.08)
-        
-        # Promotion effect
-        promotion_boost = 1.25 if promotion == 1 else 1.0
-        
-        # Competitor pricing effect
-        if competitor_price > price:
-            competition_boost = 1.15
-        elif competitor_price < price:
-            competition_boost = 0.90
-        else:
-            competition_boost = 1.0
-        
-        # Day of week effect (weekend boost)
-        day_factor = 1.1 if day_of_week in [6, 7] else 1.0
-        
-        # Seasonal effect
-        seasonal_factor = 1.0 + 0.15 * abs(6 - month) / 6
-        
-        # Inventory effect
-        inventory_factor = min(1.0, inventory_level / 500)
-        
-        # Calculate prediction
-        prediction = (base_demand * price_factor * promotion_boost * 
-                     competition_boost * day_factor * seasonal_factor * 
-                     inventory_factor)
-        
-        # Add small random variation for realism
-        prediction *= (1 + random.uniform(-0.05, 0.05))
-        
-        return max(0, round(prediction, 2))
-        
-    except Exception as e:
-        raise ValueError(f"Prediction error: {str(e)}")
-
-@app.route('/')
-def home():
-    """Serve the web interface"""
-    return """
-    <!DOCTYPE html>
-    <html lang="en">
-    <head>
-        <meta charset="UTF-8">
-        <meta name="viewport" content="width=device-width, initial-scale=1.0">
-        <title>Bosch FMCG Pricing API - Interactive Tester</title>
-        <style>
-            * {
-                margin: 0;
-                padding: 0;
-                box-sizing: border-box;
-            }
-            
-            body {
-                font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-                background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                min-height: 100vh;
-                padding: 20px;
-            }
-            
-            .container {
-                max-width: 1200px;
-                margin: 0 auto;
-                background: white;
-                border-radius: 20px;
-                box-shadow: 0 20px 60px rgba(0,0,0,0.3);
-                overflow: hidden;
-            }
-            
-            .header {
-                background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                color: white;
-                padding: 40px 30px;
-                text-align: center;
-            }
-            
-            .header h1 {
-                font-size: 2.5em;
-                margin-bottom: 10px;
-            }
-            
-            .header p {
-                font-size: 1.1em;
-                opacity: 0.9;
-            }
-            
-            .content {
-                padding: 30px;
-            }
-            
-            .url-section {
-                background: #f8f9fa;
-                padding: 20px;
-                border-radius: 10px;
-                margin-bottom: 30px;
-                border: 2px solid #dee2e6;
-            }
-            
-            .url-section label {
-                display: block;
-                font-weight: 600;
-                margin-bottom: 10px;
-                color: #333;
-            }
-            
-            .url-section input {
-                width: 100%;
-                padding: 12px;
-                border: 2px solid #ddd;
-                border-radius: 8px;
-                font-size: 1em;
-                transition: border-color 0.3s;
-            }
-            
-            .url-section input:focus {
-                outline: none;
-                border-color: #667eea;
-            }
-            
-            .url-section small {
-                display: block;
-                margin-top: 8px;
-                color: #666;
-            }
-            
-            .test-section {
-                background: white;
-                border: 2px solid #e9ecef;
-                border-radius: 10px;
-                padding: 20px;
-                margin-bottom: 20px;
-            }
-            
-            .test-section h3 {
-                color: #333;
-                margin-bottom: 15px;
-                display: flex;
-                align-items: center;
-                gap: 10px;
-                font-size: 1.3em;
-            }
-            
-            .input-grid {
-                display: grid;
-                grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-                gap: 15px;
-                margin-bottom: 20px;
-            }
-            
-            .input-group {
-                display: flex;
-                flex-direction: column;
-            }
-            
-            .input-group label {
-                font-weight: 600;
-                margin-bottom: 5px;
-                color: #555;
-                font-size: 0.9em;
-            }
-            
-            .input-group input,
-            .input-group select {
-                padding: 10px;
-                border: 2px solid #ddd;
-                border-radius: 6px;
-                font-size: 1em;
-                transition: border-color 0.3s;
-            }
-            
-            .input-group input:focus,
-            .input-group select:focus {
-                outline: none;
-                border-color: #667eea;
-            }
-            
-            .button-group {
-                display: flex;
-                gap: 10px;
-                flex-wrap: wrap;
-            }
-            
-            button {
-                padding: 12px 24px;
-                border: none;
-                border-radius: 8px;
-                font-size: 1em;
-                font-weight: 600;
-                cursor: pointer;
-                transition: all 0.3s;
-            }
-            
-            button:disabled {
-                opacity: 0.6;
-                cursor: not-allowed;
-            }
-            
-            .btn-primary {
-                background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                color: white;
-            }
-            
-            .btn-primary:hover:not(:disabled) {
-                transform: translateY(-2px);
-                box-shadow: 0 5px 15px rgba(102, 126, 234, 0.4);
-            }
-            
-            .btn-secondary {
-                background: #6c757d;
-                color: white;
-            }
-            
-            .btn-secondary:hover:not(:disabled) {
-                background: #5a6268;
-            }
-            
-            .btn-success {
-                background: #28a745;
-                color: white;
-            }
-            
-            .btn-success:hover:not(:disabled) {
-                background: #218838;
-            }
-            
-            .btn-info {
-                background: #17a2b8;
-                color: white;
-            }
-            
-            .btn-info:hover:not(:disabled) {
-                background: #138496;
-            }
-            
-            .result-box {
-                background: #f8f9fa;
-                border-left: 4px solid #667eea;
-                padding: 15px;
-                border-radius: 6px;
-                margin-top: 15px;
-                display: none;
-            }
-            
-            .result-box.show {
-                display: block;
-                animation: slideIn 0.3s ease-out;
-            }
-            
-            @keyframes slideIn {
-                from {
-                    opacity: 0;
-                    transform: translateY(-10px);
-                }
-                to {
-                    opacity: 1;
-                    transform: translateY(0);
-                }
-            }
-            
-            .result-box h4 {
-                color: #333;
-                margin-bottom: 10px;
-            }
-            
-            .result-box pre {
-                background: white;
-                padding: 15px;
-                border-radius: 6px;
-                overflow-x: auto;
-                font-size: 0.9em;
-                border: 1px solid #dee2e6;
-                max-height: 400px;
-                overflow-y: auto;
-            }
-            
-            .status-badge {
-                display: inline-block;
-                padding: 5px 12px;
-                border-radius: 20px;
-                font-size: 0.85em;
-                font-weight: 600;
-                margin-left: 10px;
-            }
-            
-            .status-success {
-                background: #d4edda;
-                color: #155724;
-            }
-            
-            .status-error {
-                background: #f8d7da;
-                color: #721c24;
-            }
-            
-            .status-loading {
-                background: #fff3cd;
-                color: #856404;
-            }
-            
-            .prediction-result {
-                background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                color: white;
-                padding: 25px;
-                border-radius: 10px;
-                margin-top: 15px;
-                display: none;
-            }
-            
-            .prediction-result.show {
-                display: block;
-                animation: slideIn 0.3s ease-out;
-            }
-            
-            .prediction-result h4 {
-                margin-bottom: 15px;
-                font-size: 1.3em;
-            }
-            
-            .prediction-value {
-                font-size: 3em;
-                font-weight: bold;
-                margin: 15px 0;
-            }
-            
-            .confidence-range {
-                font-size: 1em;
-                opacity: 0.9;
-                margin-top: 10px;
-            }
-            
-            .quick-tests {
-                display: grid;
-                grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
-                gap: 15px;
-                margin-top: 20px;
-            }
-            
-            .quick-test-card {
-                background: white;
-                border: 2px solid #e9ecef;
-                border-radius: 10px;
-                padding: 20px;
-                cursor: pointer;
-                transition: all 0.3s;
-                text-align: center;
-            }
-            
-            .quick-test-card:hover {
-                border-color: #667eea;
-                transform: translateY(-2px);
-                box-shadow: 0 5px 15px rgba(0,0,0,0.1);
-            }
-            
-            .quick-test-card .icon {
-                font-size: 2.5em;
-                margin-bottom: 10px;
-            }
-            
-            .quick-test-card h4 {
-                color: #333;
-                margin-bottom: 10px;
-                font-size: 1.1em;
-            }
-            
-            .quick-test-card p {
-                color: #666;
-                font-size: 0.9em;
-            }
-            
-            .loader {
-                border: 3px solid #f3f3f3;
-                border-top: 3px solid #667eea;
-                border-radius: 50%;
-                width: 20px;
-                height: 20px;
-                animation: spin 1s linear infinite;
-                display: inline-block;
-                margin-left: 10px;
-            }
-            
-            @keyframes spin {
-                0% { transform: rotate(0deg); }
-                100% { transform: rotate(360deg); }
-            }
-            
-            .footer {
-                text-align: center;
-                padding: 20px;
-                background: #f8f9fa;
-                color: #666;
-                font-size: 0.9em;
-            }
-            
-            @media (max-width: 768px) {
-                .header h1 {
-                    font-size: 1.8em;
-                }
-                
-                .input-grid {
-                    grid-template-columns: 1fr;
-                }
-                
-                .prediction-value {
-                    font-size: 2em;
-                }
-            }
-        </style>
-    </head>
-    <body>
-        <div class="container">
-            <div class="header">
-                <h1>🎯 Bosch FMCG Pricing API Tester</h1>
-                <p>Interactive testing interface for demand prediction model</p>
-            </div>
-            
-            <div class="content">
-                <!-- API URL Configuration -->
-                <div class="url-section">
-                    <label for="apiUrl">🔗 API Base URL</label>
-                    <input 
-                        type="text" 
-                        id="apiUrl" 
-                        placeholder="Enter your API URL (e.g., https://your-app.onrender.com)"
-                        value=""
-                    >
-                    <small>Enter your Render deployment URL or use http://127.0.0.1:5000 for local testing</small>
-                </div>
-                
-                <!-- Quick Health Check -->
-                <div class="test-section">
-                    <h3>🏥 API Status & Information</h3>
-                    <p style="color: #666; margin-bottom: 15px;">Verify your API is running and get basic information</p>
-                    <div class="button-group">
-                        <button class="btn-success" onclick="testHealth()">
-                            Check Health
-                        </button>
-                        <button class="btn-info" onclick="testInfo()">
-                            API Info
-                        </button>
-                        <button class="btn-info" onclick="testModelInfo()">
-                            Model Details
-                        </button>
-                    </div>
-                    <div id="quickTestResult" class="result-box"></div>
-                </div>
-                
-                <!-- Single Prediction -->
-                <div class="test-section">
-                    <h3>📊 Demand Prediction Calculator</h3>
-                    <p style="color: #666; margin-bottom: 15px;">Enter product and market conditions to predict demand</p>
-                    
-                    <div class="input-grid">
-                        <div class="input-group">
-                            <label for="price">💰 Price ($)</label>
-                            <input type="number" id="price" value="10.50" step="0.1" min="0">
-                        </div>
-                        <div class="input-group">
-                            <label for="promotion">🎁 Promotion Active</label>
-                            <select id="promotion">
-                                <option value="0">No Promotion</option>
-                                <option value="1">Promotion Active</option>
-                            </select>
-                        </div>
-                        <div class="input-group">
-                            <label for="competitorPrice">🏪 Competitor Price ($)</label>
-                            <input type="number" id="competitorPrice" value="11.00" step="0.1" min="0">
-                        </div>
-                        <div class="input-group">
-                            <label for="dayOfWeek">📅 Day of Week</label>
-                            <select id="dayOfWeek">
-                                <option value="1">Monday</option>
-                                <option value="2">Tuesday</option>
-                                <option value="3" selected>Wednesday</option>
-                                <option value="4">Thursday</option>
-                                <option value="5">Friday</option>
-                                <option value="6">Saturday</option>
-                                <option value="7">Sunday</option>
-                            </select>
-                        </div>
-                        <div class="input-group">
-                            <label for="month">📆 Month</label>
-                            <select id="month">
-                                <option value="1">January</option>
-                                <option value="2">February</option>
-                                <option value="3">March</option>
-                                <option value="4">April</option>
-                                <option value="5">May</option>
-                                <option value="6" selected>June</option>
-                                <option value="7">July</option>
-                                <option value="8">August</option>
-                                <option value="9">September</option>
-                                <option value="10">October</option>
-                                <option value="11">November</option>
-                                <option value="12">December</option>
-                            </select>
-                        </div>
-                        <div class="input-group">
-                            <label for="inventoryLevel">📦 Inventory Level</label>
-                            <input type="number" id="inventoryLevel" value="500" min="0">
-                        </div>
-                    </div>
-                    <div class="button-group">
-                        <button class="btn-primary" onclick="predictDemand()">
-                            🚀 Predict Demand
-                        </button>
-                        <button class="btn-secondary" onclick="resetForm()">
-                            🔄 Reset Form
-                        </button>
-                    </div>
-                    <div id="predictionResult" class="prediction-result"></div>
-                    <div id="predictionDetails" class="result-box"></div>
-                </div>
-                
-                <!-- Quick Test Scenarios -->
-                <div class="test-section">
-                    <h3>⚡ Quick Test Scenarios</h3>
-                    <p style="color: #666; margin-bottom: 15px;">Click any scenario to auto-fill the form and test</p>
-                    <div class="quick-tests">
-                        <div class="quick-test-card" onclick="loadScenario('standard')">
-                            <div class="icon">📊</div>
-                            <h4>Standard Pricing</h4>
-                            <p>Normal pricing without promotion</p>
-                        </div>
-                        <div class="quick-test-card" onclick="loadScenario('promotion')">
-                            <div class="icon">🎉</div>
-                            <h4>Promotion Active</h4>
-                            <p>Promotional pricing + weekend boost</p>
-                        </div>
-                        <div class="quick-test-card" onclick="loadScenario('high')">
-                            <div class="icon">💰</div>
-                            <h4>Premium Pricing</h4>
-                            <p>High price strategy</p>
-                        </div>
-                        <div class="quick-test-card" onclick="loadScenario('competitive')">
-                            <div class="icon">⚡</div>
-                            <h4>Competitive Edge</h4>
-                            <p>Aggressive pricing vs competitors</p>
-                        </div>
-                    </div>
-                </div>
-            </div>
-            
-            <div class="footer">
-                <p>Bosch FMCG Pricing Optimization API | Developed for BAN6800 Final Project</p>
-                <p style="margin-top: 5px; font-size: 0.85em;">© 2024 All Rights Reserved</p>
-            </div>
-        </div>
-
-        <script>
-            const scenarios = {
-                standard: {
-                    price: 10.50,
-                    promotion: 0,
-                    competitorPrice: 11.00,
-                    dayOfWeek: 3,
-                    month: 6,
-                    inventoryLevel: 500
-                },
-                promotion: {
-                    price: 9.00,
-                    promotion: 1,
-                    competitorPrice: 10.50,
-                    dayOfWeek: 6,
-                    month: 12,
-                    inventoryLevel: 800
-                },
-                high: {
-                    price: 15.00,
-                    promotion: 0,
-                    competitorPrice: 12.00,
-                    dayOfWeek: 2,
-                    month: 3,
-                    inventoryLevel: 300
-                },
-                competitive: {
-                    price: 8.50,
-                    promotion: 1,
-                    competitorPrice: 11.00,
-                    dayOfWeek: 7,
-                    month: 6,
-                    inventoryLevel: 1000
-                }
-            };
-
-            function getApiUrl() {
-                const url = document.getElementById('apiUrl').value.trim();
-                if (!url) {
-                    alert('Please enter your API URL first!');
-                    document.getElementById('apiUrl').focus();
-                    return null;
-                }
-                return url;
-            }
-
-            function showLoading(elementId) {
-                const element = document.getElementById(elementId);
-                element.innerHTML = '<div class="loader"></div> Loading...';
-                element.classList.add('show');
-            }
-
-            function showResult(elementId, html) {
-                const element = document.getElementById(elementId);
-                element.innerHTML = html;
-                element.classList.add('show');
-            }
-
-            async function testHealth() {
-                const apiUrl = getApiUrl();
-                if (!apiUrl) return;
-                
-                showLoading('quickTestResult');
-                try {
-                    const response = await fetch(`${apiUrl}/health`);
-                    const data = await response.json();
-                    
-                    const html = `
-                        <h4>Health Check <span class="status-badge status-success">✓ HEALTHY</span></h4>
-                        <pre>${JSON.stringify(data, null, 2)}</pre>
-                    `;
-                    showResult('quickTestResult', html);
-                } catch (error) {
-                    const html = `
-                        <h4>Health Check <span class="status-badge status-error">✗ ERROR</span></h4>
-                        <p style="color: #721c24; margin-top: 10px;"><strong>Error:</strong> ${error.message}</p>
-                        <p style="color: #666; margin-top: 10px;">Make sure your API URL is correct and the service is running.</p>
-                    `;
-                    showResult('quickTestResult', html);
-                }
-            }
-
-            async function testInfo() {
-                const apiUrl = getApiUrl();
-                if (!apiUrl) return;
-                
-                showLoading('quickTestResult');
-                try {
-                    const response = await fetch(`${apiUrl}/`);
-                    const data = await response.json();
-                    
-                    const html = `
-                        <h4>API Information <span class="status-badge status-success">✓ SUCCESS</span></h4>
-                        <pre>${JSON.stringify(data, null, 2)}</pre>
-                    `;
-                    showResult('quickTestResult', html);
-                } catch (error) {
-                    const html = `
-                        <h4>API Information <span class="status-badge status-error">✗ ERROR</span></h4>
-                        <p style="color: #721c24; margin-top: 10px;"><strong>Error:</strong> ${error.message}</p>
-                    `;
-                    showResult('quickTestResult', html);
-                }
-            }
-
-            async function testModelInfo() {
-                const apiUrl = getApiUrl();
-                if (!apiUrl) return;
-                
-                showLoading('quickTestResult');
-                try {
-                    const response = await fetch(`${apiUrl}/info`);
-                    const data = await response.json();
-                    
-                    const html = `
-                        <h4>Model Information <span class="status-badge status-success">✓ SUCCESS</span></h4>
-                        <pre>${JSON.stringify(data, null, 2)}</pre>
-                    `;
-                    showResult('quickTestResult', html);
-                } catch (error) {
-                    const html = `
-                        <h4>Model Information <span class="status-badge status-error">✗ ERROR</span></h4>
-                        <p style="color: #721c24; margin-top: 10px;"><strong>Error:</strong> ${error.message}</p>
-                    `;
-                    showResult('quickTestResult', html);
-                }
-            }
-
-            async function predictDemand() {
-                const apiUrl = getApiUrl();
-                if (!apiUrl) return;
-                
-                const predictionData = {
-                    price: parseFloat(document.getElementById('price').value),
-                    promotion: parseInt(document.getElementById('promotion').value),
-                    competitor_price: parseFloat(document.getElementById('competitorPrice').value),
-                    day_of_week: parseInt(document.getElementById('dayOfWeek').value),
-                    month: parseInt(document.getElementById('month').value),
-                    inventory_level: parseInt(document.getElementById('inventoryLevel').value)
-                };
-
-                document.getElementById('predictionResult').innerHTML = '<div class="loader"></div> Calculating demand prediction...';
-                document.getElementById('predictionResult').classList.add('show');
-                
-                try {
-                    const response = await fetch(`${apiUrl}/predict`, {
-                        method: 'POST',
-                        headers: {
-                            'Content-Type': 'application/json'
-                        },
-                        body: JSON.stringify(predictionData)
-                    });
-                    
-                    const data = await response.json();
-                    
-                    if (data.status === 'success') {
-                        const resultHtml = `
-                            <h4>🎯 Predicted Demand</h4>
-                            <div class="prediction-value">${data.predicted_demand.toFixed(2)} units</div>
-                            <div class="confidence-range">
-                                <strong>95% Confidence Interval:</strong><br>
-                                ${data.confidence_interval.lower} - ${data.confidence_interval.upper} units
-                            </div>
-                        `;
-                        document.getElementById('predictionResult').innerHTML = resultHtml;
-                        
-                        const detailsHtml = `
-                            <h4>Full Response <span class="status-badge status-success">✓ SUCCESS</span></h4>
-                            <pre>${JSON.stringify(data, null, 2)}</pre>
-                        `;
-                        showResult('predictionDetails', detailsHtml);
-                    } else {
-                        const errorHtml = `
-                            <h4 style="color: white;">Prediction Failed</h4>
-                            <p style="margin-top: 10px;">${data.error || 'Unknown error occurred'}</p>
-                        `;
-                        document.getElementById('predictionResult').innerHTML = errorHtml;
-                        document.getElementById('predictionResult').style.background = 'linear-gradient(135deg, #f85032 0%, #e73827 100%)';
-                    }
-                } catch (error) {
-                    const errorHtml = `
-                        <h4 style="color: white;">Connection Failed</h4>
-                        <p style="margin-top: 10px;"><strong>Error:</strong> ${error.message}</p>
-                        <p style="margin-top: 10px;">Check if your API URL is correct and the service is running.</p>
-                    `;
-                    document.getElementById('predictionResult').innerHTML = errorHtml;
-                    document.getElementById('predictionResult').style.background = 'linear-gradient(135deg, #f85032 0%, #e73827 100%)';
-                }
-            }
-
-            function loadScenario(scenarioName) {
-                const scenario = scenarios[scenarioName];
-                document.getElementById('price').value = scenario.price;
-                document.getElementById('promotion').value = scenario.promotion;
-                document.getElementById('competitorPrice').value = scenario.competitorPrice;
-                document.getElementById('dayOfWeek').value = scenario.dayOfWeek;
-                document.getElementById('month').value = scenario.month;
-                document.getElementById('inventoryLevel').value = scenario.inventoryLevel;
-                
-                // Scroll to prediction section smoothly
-                document.querySelector('.test-section:nth-child(3)').scrollIntoView({ behavior: 'smooth', block: 'start' });
-                
-                // Highlight the form briefly
-                const section = document.querySelector('.test-section:nth-child(3)');
-                section.style.border = '3px solid #667eea';
-                setTimeout(() => {
-                    section.style.border = '2px solid #e9ecef';
-                }, 1000);
-            }
-
-            function resetForm() {
-                loadScenario('standard');
-                document.getElementById('predictionResult').classList.remove('show');
-                document.getElementById('predictionDetails').classList.remove('show');
-            }
-
-            // Load saved API URL from localStorage if available
-            window.addEventListener('DOMContentLoaded', () => {
-                const currentUrl = window.location.origin;
-                document.getElementById('apiUrl').value = currentUrl;
-                localStorage.setItem('bosch_api_url', currentUrl);
-                
-                // Save URL to localStorage when changed
-                document.getElementById('apiUrl').addEventListener('change', (e) => {
-                    localStorage.setItem('bosch_api_url', e.target.value);
-                });
-            });
-        </script>
-    </body>
-    </html>
-    """
-
-@app.route('/api')
-def api_info():
-    """API information endpoint"""
-    return jsonify({
-        'service': 'Bosch FMCG Pricing Optimization API',
-        'version': '1.0',
-        'status': 'active',
-        'endpoints': {
-            'predict': '/predict',
-            'health': '/health',
-            'info': '/info',
-            'batch_predict': '/batch-predict'
-        },
-        'documentation': 'https://api-docs.bosch-pricing.com'
-    })
-
-@app.route('/health')
-def health_check():
-    """Health check endpoint"""
-    return jsonify({
-        'status': 'healthy',
-        'timestamp': datetime.now().isoformat(),
-        'service': 'bosch-pricing-predictor',
-        'region': 'us-east-1'
-    })
-
-@app.route('/info')
-def info():
-    """API information endpoint"""
-    return jsonify({
-        'model_name': 'Bosch FMCG Demand Prediction Model',
-        'model_version': '1.0',
-        'framework': 'XGBoost',
-        'features': [
-            'price',
-            'promotion',
-            'competitor_price',
-            'day_of_week',
-            'month',
-            'inventory_level'
-        ],
-        'description': 'Predicts product demand based on pricing and market conditions',
-        'last_updated': '2024-11-27'
-    })
-
-@app.route('/predict', methods=['POST'])
-def predict():
-    """
-    Main prediction endpoint
-    
-    Example request:
-    {
-        "price": 10.50,
-        "promotion": 1,
-        "competitor_price": 11.00,
-        "day_of_week": 3,
-        "month": 6,
-        "inventory_level": 500
-    }
-    """
-    try:
-        # Parse input
-        if request.is_json:
-            input_data = request.get_json()
-        else:
-            return jsonify({
-                'error': 'Request must be JSON',
-                'status': 'error'
-            }), 400
-        
-        # Validate required fields
-        required_fields = ['price', 'promotion', 'competitor_price', 
-                          'day_of_week', 'month']
-        missing_fields = [field for field in required_fields 
-                         if field not in input_data]
-        
-        if missing_fields:
-            return jsonify({
-                'error': f'Missing required fields: {", ".join(missing_fields)}',
-                'status': 'error',
-                'required_fields': required_fields
-            }), 400
-        
-        # Make prediction
-        prediction = predict_demand(input_data)
-        
-        # Calculate confidence interval (simulated)
-        confidence_lower = round(prediction * 0.85, 2)
-        confidence_upper = round(prediction * 1.15, 2)
-        
-        # Return response
-        return jsonify({
-            'predicted_demand': prediction,
-            'confidence_interval': {
-                'lower': confidence_lower,
-                'upper': confidence_upper,
-                'confidence_level': 0.95
-            },
-            'input_features': input_data,
-            'model_version': '1.0',
-            'timestamp': datetime.now().isoformat(),
-            'status': 'success'
-        }), 200
-        
-    except ValueError as e:
-        return jsonify({
-            'error': str(e),
-            'status': 'error'
-        }), 400
-        
-    except Exception as e:
-        return jsonify({
-            'error': 'Internal server error',
-            'details': str(e),
-            'status': 'error'
-        }), 500
-
-@app.route('/batch-predict', methods=['POST'])
-def batch_predict():
-    """
-    Batch prediction endpoint for multiple scenarios
-    
-    Example request:
-    {
-        "scenarios": [
-            {"price": 10.0, "promotion": 1, ...},
-            {"price": 11.0, "promotion": 0, ...}
-        ]
-    }
-    """
-    try:
-        if not request.is_json:
-            return jsonify({
-                'error': 'Request must be JSON',
-                'status': 'error'
-            }), 400
-        
-        data = request.get_json()
-        scenarios = data.get('scenarios', [])
-        
-        if not scenarios:
-            return jsonify({
-                'error': 'No scenarios provided',
-                'status': 'error'
-            }), 400
-        
-        # Make predictions for all scenarios
-        predictions = []
-        for i, scenario in enumerate(scenarios):
-            try:
-                prediction = predict_demand(scenario)
-                predictions.append({
-                    'scenario_id': i + 1,
-                    'predicted_demand': prediction,
-                    'input': scenario,
-                    'status': 'success'
-                })
-            except Exception as e:
-                predictions.append({
-                    'scenario_id': i + 1,
-                    'error': str(e),
-                    'input': scenario,
-                    'status': 'error'
-                })
-        
-        return jsonify({
-            'predictions': predictions,
-            'total_scenarios': len(scenarios),
-            'successful': sum(1 for p in predictions if p['status'] == 'success'),
-            'timestamp': datetime.now().isoformat(),
-            'status': 'success'
-        }), 200
-        
-    except Exception as e:
-        return jsonify({
-            'error': 'Internal server error',
-            'details': str(e),
-            'status': 'error'
-        }), 500
-
-@app.errorhandler(404)
-def not_found(error):
-    """Handle 404 errors"""
-    return jsonify({
-        'error': 'Endpoint not found',
-        'status': 'error',
-        'available_endpoints': ['/predict', '/health', '/info', '/batch-predict']
-    }), 404
-
-@app.errorhandler(500)
-def internal_error(error):
-    """Handle 500 errors"""
-    return jsonify({
-        'error': 'Internal server error',
-        'status': 'error'
-    }), 500
-
-if __name__ == '__main__':
-    print("="*60)
-    print("  Bosch FMCG Pricing API Server")
-    print("="*60)
-    print("\nServer starting...")
-    print("Web Interface: http://127.0.0.1:5000")
-    print("API Endpoints:")
-    print("  GET  /              - Web Interface")
-    print("  GET  /api           - API information")
-    print("  GET  /health        - Health check")
-    print("  GET  /info          - Model information")
-    print("  POST /predict       - Single prediction")
-    print("  POST /batch-predict - Batch predictions")
-    print("\nExample usage:")
-    print('  curl -X POST http://127.0.0.1:5000/predict \\')
-    print('       -H "Content-Type: application/json" \\')
-    print('       -d \'{"price": 10.5, "promotion": 1, "competitor_price": 11.0,')
-    print('            "day_of_week": 3, "month": 6, "inventory_level": 500}\'')
-    print("\nPress Ctrl+C to stop the server")
-    print("="*60 + "\n")
-    
-    # Run server
-    app.run(debug=True, host='0.0.0.0', port=5000)
\ No newline at end of file
+"""
+Bosch FMCG Pricing Model - Mock API Server
+Simulates AWS API Gateway endpoint locally for testing
+"""
+
+from flask import Flask, request, Response
+from flask.json.provider import JSONProvider
+import json
+from concurrent.futures import Future
+from datetime import datetime, timezone
+from functools import lru_cache
+import gzip
+import hashlib
+import io
+import itertools
+import math
+import os
+import queue
+import re
+import threading
+import time
+import zlib
+from typing import List, Tuple, Union
+import msgspec
+import numpy as np
+import orjson
+
+try:
+    import msgpack
+except ImportError:  # Optional: enables the MessagePack transport on /batch-predict
+    msgpack = None
+
+try:
+    import rcssmin
+    import rjsmin
+except ImportError:  # Optional: serves the web interface's CSS/JS unminified
+    rcssmin = rjsmin = None
+
+try:
+    from flask_compress import Compress
+except ImportError:  # Optional: JSON responses go out uncompressed
+    Compress = None
+
+try:
+    from numba import njit, prange
+    _NUMBA_AVAILABLE = True
+except ImportError:  # Optional: falls back to the pure-Python demand core
+    _NUMBA_AVAILABLE = False
+
+MSGPACK_MIMETYPE = 'application/msgpack'
+
+ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+class ORJSONProvider(JSONProvider):
+    """Flask JSON provider backed by orjson for jsonify and request.get_json"""
+    
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=ORJSON_OPTIONS).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+app = Flask(__name__)
+app.json = ORJSONProvider(app)
+
+if Compress is not None:
+    # Compress sizeable buffered API bodies at a cheap level. Streamed
+    # responses (large /batch-predict results, NDJSON) are skipped here,
+    # since flask-compress would buffer them whole; streamed_response gzips
+    # those chunk by chunk instead. The landing page is served pre-gzipped
+    app.config.update(
+        COMPRESS_ALGORITHM=['zstd', 'br', 'gzip'],
+        COMPRESS_MIMETYPES=['application/json', MSGPACK_MIMETYPE],
+        COMPRESS_MIN_SIZE=1024,
+        COMPRESS_LEVEL=3,
+        COMPRESS_BR_LEVEL=3,
+        COMPRESS_ZSTD_LEVEL=3,
+        COMPRESS_STREAMS=False
+    )
+    Compress(app)
+
+def json_response(obj, status=200):
+    """JSON response encoded by orjson straight to bytes (jsonify round-trips through str)"""
+    return app.response_class(orjson.dumps(obj, option=ORJSON_OPTIONS),
+                              status=status, mimetype='application/json')
+
+# Model input features, in the column order used by the batch kernel
+FEATURE_ORDER = ('price', 'promotion', 'competitor_price',
+                 'day_of_week', 'month', 'inventory_level')
+FEATURE_DEFAULTS = (10.0, 0, 10.0, 1, 1, 500)
+FEATURE_TYPES = (float, int, float, int, int, int)
+# (key, default, type) per feature, built once for the per-request extractor
+FEATURE_SCHEMA = tuple(zip(FEATURE_ORDER, FEATURE_DEFAULTS, FEATURE_TYPES))
+# Values each feature accepts once coerced, as exclusive (low, high) bounds
+# (NaN fails them), and how error messages describe that rule. Integers
+# must fit the int64 arguments of the compiled core. A prediction is at
+# most ~160 x |price|, so PRICE_LIMIT keeps every prediction, and every
+# value inside the kernels, finite (as the 'ninf'/'nnan' fastmath flags assume)
+PRICE_LIMIT = 1e300
+_INT64_BOUNDS = (-2**63 - 1, 2**63)
+FEATURE_BOUNDS = ((-PRICE_LIMIT, PRICE_LIMIT), _INT64_BOUNDS, (-math.inf, math.inf),
+                  (0, 8), (0, 13), _INT64_BOUNDS)
+FEATURE_RULES = ('a number between -1e300 and 1e300', 'a 64-bit integer', 'a finite number',
+                 'an integer from 1 to 7', 'an integer from 1 to 12', 'a 64-bit integer')
+_FEATURE_LOW = np.array([low for low, high in FEATURE_BOUNDS], dtype=np.float64)
+_FEATURE_HIGH = np.array([high for low, high in FEATURE_BOUNDS], dtype=np.float64)
+
+class PredictRequest(msgspec.Struct):
+    """/predict payload, decoded, validated and coerced in one msgspec pass"""
+    price: float
+    promotion: int
+    competitor_price: float
+    day_of_week: int
+    month: int
+    inventory_level: int = 500
+
+class FeatureMatrixRequest(msgspec.Struct):
+    """
+    /predict/batch payload: rows of the six features in FEATURE_ORDER
+    
+    Columns are typed like PredictRequest's fields, so the integer features
+    get the same validation as on /predict (3.0 is accepted, 3.7 rejected).
+    """
+    features: List[Tuple[float, int, float, int, int, int]] = []
+
+# Fields without a default, checked by msgspec while decoding; hoisted as an
+# immutable constant for the 400 error body
+PREDICT_REQUIRED_FIELDS = PredictRequest.__struct_fields__[
+    :len(PredictRequest.__struct_fields__) - len(PredictRequest.__struct_defaults__)]
+
+# Calendar effects as lookup tables, indexed by day_of_week (1-7) and month (1-12)
+_DAY_FACTOR = (1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.1, 1.1)
+_SEASONAL = tuple(1.0 + 0.15 * abs(6 - m) / 6 for m in range(13))
+_DAY_FACTOR_ARR = np.array(_DAY_FACTOR)
+_SEASONAL_ARR = np.array(_SEASONAL)
+
+# The +/-5% prediction noise is a demo touch, off by default for deterministic
+# responses; set PREDICTION_NOISE=1 to turn it on
+ADD_NOISE = os.getenv('PREDICTION_NOISE', '0') == '1'
+
+# Single draws are read from a ring of samples generated once per process
+NOISE_BUFFER_SIZE = 1 << 16
+
+def _reseed_noise():
+    """
+    Give this process its own noise ring, ring position and generators
+    
+    Registered to run again in every forked child, so gunicorn workers
+    forked from a preloaded master don't replay the master's sequence.
+    """
+    global _noise_buf, _noise_idx, _rng_local
+    _noise_buf = (np.random.default_rng().uniform(-0.05, 0.05, NOISE_BUFFER_SIZE).tolist()
+                  if ADD_NOISE else None)
+    _noise_idx = itertools.count()
+    _rng_local = threading.local()
+
+_reseed_noise()
+os.register_at_fork(after_in_child=_reseed_noise)
+
+def draw_noise(n=None):
+    """
+    Draw prediction noise
+    
+    A single draw (n=None) is the next float from the prefilled ring buffer;
+    an array of n values comes from a per-thread PCG64 generator (numpy
+    Generators aren't thread-safe). Returns None when ADD_NOISE is off.
+    """
+    if not ADD_NOISE:
+        return None
+    if n is None:
+        return _noise_buf[next(_noise_idx) & (NOISE_BUFFER_SIZE - 1)]
+    rng = getattr(_rng_local, 'rng', None)
+    if rng is None:
+        rng = _rng_local.rng = np.random.default_rng()
+    return rng.uniform(-0.05, 0.05, n)
+
+# Response timestamps (UTC, "Z" suffix) are refreshed at most every 100 ms
+# rather than per request; PRECISE_TIMESTAMPS=1 formats one per call instead
+TIMESTAMP_TTL = 0.1
+TIMESTAMP_PRECISE = os.getenv('PRECISE_TIMESTAMPS', '0') == '1'
+TIMESTAMP_FORMAT = '%Y-%m-%dT%H:%M:%S.%fZ'
+_timestamp = (0.0, '')
+
+def current_timestamp():
+    """Return the response timestamp, reformatting it only once per TIMESTAMP_TTL"""
+    global _timestamp
+    if TIMESTAMP_PRECISE:
+        return datetime.now(timezone.utc).strftime(TIMESTAMP_FORMAT)
+    stamped_at, text = _timestamp
+    now = time.monotonic()
+    if now - stamped_at > TIMESTAMP_TTL:
+        text = datetime.now(timezone.utc).strftime(TIMESTAMP_FORMAT)
+        _timestamp = (now, text)
+    return text
+
+def _demand_core(price, promotion, competitor_price, day_of_week, month,
+                 inventory_level, noise):
+    """
+    Numeric core of the demand model on plain floats/ints
+    
+    Kept free of dicts and Python objects so Numba can compile it.
+    """
+    # Simple demand prediction logic
+    base_demand = 1000.0
+    
+    # Price elasticity
+    price_factor = max(0.0, 1 - (price - 10) * 0.08)
+    
+    # Promotion effect
+    promotion_boost = 1.0 + 0.25 * (promotion == 1)
+    
+    # Competitor pricing effect
+    competition_boost = (1.0 + 0.15 * (competitor_price > price)
+                         - 0.10 * (competitor_price < price))
+    
+    # Day of week effect (weekend boost)
+    day_factor = _DAY_FACTOR[day_of_week]
+    
+    # Seasonal effect
+    seasonal_factor = _SEASONAL[month]
+    
+    # Inventory effect
+    inventory_factor = min(1.0, inventory_level / 500)
+    
+    # Calculate prediction, with optional random variation for realism
+    prediction = (base_demand * price_factor * promotion_boost *
+                  competition_boost * day_factor * seasonal_factor *
+                  inventory_factor) * (1 + noise)
+    
+    # Half-up to the cent; floor rather than round() so Numba emits a single
+    # instruction, and rather than int() so huge values can't overflow int64
+    return max(0.0, np.floor(prediction * 100.0 + 0.5) / 100)
+
+# Only the fastmath flags that can't change a finite result. 'reassoc' and
+# 'contract' reorder or fuse the factor multiplies and move ~1-2% of
+# predictions by a cent versus the pure-Python core, so answers would
+# depend on whether Numba is installed; 'arcp' turns the final "/ 100"
+# into "* 0.01" and leaves values like 1380.1200000000001 in the JSON
+FASTMATH_FLAGS = {'nnan', 'ninf', 'nsz'}
+
+def _specialize_demand_core():
+    """
+    Build the pure-Python fallback of _demand_core as one generated expression
+    
+    Coefficients are literals CPython can constant-fold, and the calendar
+    tables are bound as default arguments so they load as fast locals.
+    Must compute exactly what _demand_core does, factor for factor, with
+    math.floor in place of np.floor.
+    """
+    src = (
+        "def _demand_core(price, promotion, competitor_price, day_of_week, month,\n"
+        "                 inventory_level, noise, _day=_DAY_FACTOR, _season=_SEASONAL,\n"
+        "                 _floor=math.floor):\n"
+        "    return max(0.0, _floor(1000.0 * max(0.0, 1 - (price - 10) * 0.08)"
+        " * (1.0 + 0.25 * (promotion == 1))"
+        " * (1.0 + 0.15 * (competitor_price > price) - 0.10 * (competitor_price < price))"
+        " * _day[day_of_week] * _season[month]"
+        " * min(1.0, inventory_level / 500) * (1 + noise) * 100.0 + 0.5) / 100)\n"
+    )
+    namespace = {'_DAY_FACTOR': _DAY_FACTOR, '_SEASONAL': _SEASONAL, 'math': math}
+    exec(src, namespace)
+    return namespace['_demand_core']
+
+if _NUMBA_AVAILABLE:
+    # Result-preserving fastmath flags only (see FASTMATH_FLAGS)
+    _demand_core = njit(cache=True, fastmath=FASTMATH_FLAGS)(_demand_core)
+    # Compile at import so the first request doesn't pay the JIT cost
+    _demand_core(10.0, 0, 10.0, 1, 1, 500, 0.0)
+else:
+    _demand_core = _specialize_demand_core()
+
+# Noise-free predictions are memoized on the exact feature values, so
+# repeated scenarios (e.g. the web UI's quick tests) skip the model entirely
+# and a cache hit returns what scoring from scratch would have.
+# Set DISABLE_CACHE=1 to score every request from scratch.
+PREDICTION_CACHE_ENABLED = os.getenv('DISABLE_CACHE', '0') != '1'
+PREDICTION_CACHE_SIZE = int(os.getenv('PREDICTION_CACHE_SIZE', '8192'))
+
+@lru_cache(maxsize=PREDICTION_CACHE_SIZE)
+def _predict_deterministic(price, promotion, competitor_price, day_of_week,
+                           month, inventory_level):
+    return _demand_core(price, promotion, competitor_price, day_of_week,
+                        month, inventory_level, 0.0)
+
+def score_features(price, promotion, competitor_price, day_of_week, month,
+                   inventory_level):
+    """
+    Run the demand core on typed features, through the cache when enabled
+    
+    Raises ValueError if a value overflows the core; the validators bound
+    every feature, so this is only a backstop.
+    """
+    try:
+        if not PREDICTION_CACHE_ENABLED:
+            return _demand_core(price, promotion, competitor_price, day_of_week,
+                                month, inventory_level, draw_noise() or 0.0)
+        
+        prediction = _predict_deterministic(price, promotion, competitor_price,
+                                            day_of_week, month, inventory_level)
+    except OverflowError as e:
+        raise ValueError(f"Prediction error: {str(e)}")
+    noise = draw_noise()
+    if noise is None:
+        return prediction
+    # Noise is folded in after the lookup so cached values stay deterministic
+    return max(0.0, math.floor(prediction * (1 + noise) * 100.0 + 0.5) / 100)
+
+def check_features(input_data):
+    """
+    Validate one scenario dict without raising
+    
+    Returns (features, None) with the typed features in FEATURE_ORDER, or
+    (None, error message naming every invalid field). Values already of
+    the target type pass straight through; anything else is coerced by
+    _coerce_value, under the same rules /predict decodes with.
+    """
+    if not isinstance(input_data, dict):
+        return None, "Prediction error: scenario must be a JSON object"
+    
+    get = input_data.get
+    features = []
+    for key, default, cast in FEATURE_SCHEMA:
+        value = get(key, default)
+        if type(value) is not cast:
+            value = _coerce_value(value, cast)
+            if value is None:
+                return None, f"Prediction error: {feature_errors(input_data)}"
+        features.append(value)
+    
+    # FEATURE_BOUNDS, unrolled: floats must be finite (e.g. NaN from
+    # MessagePack or a "nan" string) and price within PRICE_LIMIT, the
+    # calendar fields in range and the other integers within int64
+    if not (-PRICE_LIMIT < features[0] < PRICE_LIMIT and math.isfinite(features[2])
+            and 1 <= features[3] <= 7 and 1 <= features[4] <= 12
+            and -2**63 <= features[1] < 2**63 and -2**63 <= features[5] < 2**63):
+        return None, f"Prediction error: {feature_errors(input_data)}"
+    
+    return features, None
+
+def _coerce_value(value, cast):
+    """
+    Convert a feature value to cast, or return None
+    
+    Uses msgspec's strict=False rules, exactly as /predict decodes: numeric
+    strings are parsed, integral floats become ints, but 1.7 or True for an
+    int field (or True for a float one) are rejected rather than truncated.
+    """
+    try:
+        return msgspec.convert(value, cast, strict=False)
+    except msgspec.ValidationError:
+        return None
+
+def feature_errors(input_data, required=()):
+    """
+    Describe every missing or invalid feature of a scenario dict
+    
+    The slow path behind check_features and the /predict 400s, so one
+    error lists all the problems with a payload rather than the first.
+    """
+    missing = [key for key in required if key not in input_data]
+    invalid = []
+    for key, cast, (low, high), rule in zip(FEATURE_ORDER, FEATURE_TYPES,
+                                           FEATURE_BOUNDS, FEATURE_RULES):
+        if key not in input_data:
+            continue
+        value = _coerce_value(input_data[key], cast)
+        if value is None or not low < value < high:
+            invalid.append(f"{key} must be {rule}, got {input_data[key]!r}")
+    
+    problems = []
+    if missing:
+        problems.append(f"missing required fields: {', '.join(missing)}")
+    problems.extend(invalid)
+    return '; '.join(problems)
+
+def payload_errors(body, required=PREDICT_REQUIRED_FIELDS):
+    """
+    Describe every missing or invalid feature of a /predict body msgspec rejected
+    
+    Returns '' when the body isn't JSON objects at all, leaving msgspec's
+    own message to explain it.
+    """
+    try:
+        data = orjson.loads(body)
+    except orjson.JSONDecodeError:
+        return ''
+    if isinstance(data, dict):
+        return feature_errors(data, required)
+    if not isinstance(data, list):
+        return ''
+    
+    problems = []
+    for i, record in enumerate(data):
+        problem = (feature_errors(record, required) if isinstance(record, dict)
+                   else 'must be a JSON object')
+        if problem:
+            problems.append(f"record {i}: {problem}")
+    return '; '.join(problems)
+
+# Simulated model prediction function
+def predict_demand(input_data):
+    """
+    Simulate demand prediction based on input features
+    
+    Kept as the public single-scenario entry point for importers of this
+    module; the HTTP handlers go through predict_demand_request and
+    score_scenarios instead. Raises ValueError on bad input.
+    """
+    features, error = check_features(input_data)
+    if error is not None:
+        raise ValueError(error)
+    return score_features(*features)
+
+def request_in_range(req):
+    """
+    Whether a decoded PredictRequest's values are within FEATURE_BOUNDS
+    
+    msgspec has typed the fields, but strict=False lets "nan"/"inf" strings
+    through, ints may exceed int64, and the calendar range still needs checking.
+    """
+    return (-PRICE_LIMIT < req.price < PRICE_LIMIT and math.isfinite(req.competitor_price)
+            and 1 <= req.day_of_week <= 7 and 1 <= req.month <= 12
+            and -2**63 <= req.promotion < 2**63 and -2**63 <= req.inventory_level < 2**63)
+
+def check_request(req):
+    """Raise ValueError, naming every invalid field, unless a decoded PredictRequest can be scored"""
+    if not request_in_range(req):
+        raise ValueError(f"Prediction error: {feature_errors(msgspec.structs.asdict(req))}")
+
+def predict_demand_request(req):
+    """
+    Simulate demand prediction for a decoded PredictRequest
+    
+    Fields are already typed by msgspec, so only check_request's checks run.
+    """
+    check_request(req)
+    return score_features(req.price, req.promotion, req.competitor_price,
+                          req.day_of_week, req.month, req.inventory_level)
+
+def check_bounds(features):
+    """Raise ValueError naming every column of the feature matrix with a value outside FEATURE_BOUNDS"""
+    # Written as "all in range" so NaN fails the check too
+    in_bounds = ((features > _FEATURE_LOW) & (features < _FEATURE_HIGH)).all(axis=0)
+    if not in_bounds.all():
+        raise ValueError('; '.join(f"{key} must be {rule}" for key, rule, ok
+                                   in zip(FEATURE_ORDER, FEATURE_RULES, in_bounds) if not ok))
+
+def predict_demand_requests(reqs):
+    """
+    Vectorized predict_demand_request for a list of decoded PredictRequests
+    
+    Returns an ndarray of predictions in request order. Raises ValueError
+    naming every invalid field of every bad record.
+    """
+    problems = [f"record {i}: {feature_errors(msgspec.structs.asdict(req))}"
+                for i, req in enumerate(reqs) if not request_in_range(req)]
+    if problems:
+        raise ValueError(f"Prediction error: {'; '.join(problems)}")
+    
+    features = np.array([msgspec.structs.astuple(req) for req in reqs],
+                        dtype=np.float64).reshape(-1, len(FEATURE_ORDER))
+    return predict_demand_batch(features, draw_noise(len(features)))
+
+def predict_demand_batch(features, noise=None):
+    """
+    Simulate demand prediction for a whole batch in one vectorized pass
+    
+    Args:
+        features: (N, 6) float64 array with columns price, promotion,
+            competitor_price, day_of_week, month, inventory_level;
+            every value must be within FEATURE_BOUNDS (check_features
+            or check_bounds checks this)
+        noise: optional length-N array of multiplicative noise (see draw_noise)
+    
+    With Numba, every row goes through the compiled _demand_core: serially
+    below PARALLEL_BATCH_MIN rows, across all cores from there on. Both
+    loops cast the row the same way, so a row's prediction doesn't depend
+    on the batch size. Without Numba the NumPy pass below mirrors
+    _demand_core in float64, factor for factor and with the same rounding.
+    """
+    if _NUMBA_AVAILABLE:
+        features = np.ascontiguousarray(features, dtype=np.float64)
+        out = np.empty(len(features))
+        if noise is None:
+            noise = np.zeros(len(features))
+        if len(features) < PARALLEL_BATCH_MIN:
+            _score_rows(features, noise, out)
+            return out
+        # The default workqueue threading layer can't take concurrent launches
+        with _parallel_lock:
+            _predict_batch_parallel(features, noise, out)
+        return out
+    
+    price, promotion, competitor_price, day_of_week, month, inventory_level = features.T
+    
+    base_demand = 1000
+    price_factor = np.maximum(0, 1 - (price - 10) * 0.08)
+    promotion_boost = 1.0 + 0.25 * (promotion == 1)
+    competition_boost = (1.0 + 0.15 * (competitor_price > price)
+                         - 0.10 * (competitor_price < price))
+    day_factor = _DAY_FACTOR_ARR[day_of_week.astype(np.intp)]
+    seasonal_factor = _SEASONAL_ARR[month.astype(np.intp)]
+    inventory_factor = np.minimum(1.0, inventory_level / 500)
+    
+    prediction = (base_demand * price_factor * promotion_boost *
+                  competition_boost * day_factor * seasonal_factor *
+                  inventory_factor)
+    if noise is not None:
+        prediction *= 1 + noise
+    
+    # Round half-up to the cent, as _demand_core does
+    return np.maximum(0, np.floor(prediction * 100 + 0.5) / 100)
+
+def score_scenarios(scenarios, start=0):
+    """
+    Score scenario dicts into /batch-predict result rows
+    
+    Every scenario is validated and coerced by check_features, the same
+    rules as a single prediction, so a row scores the same whatever else
+    is in the batch. Bad rows are reported as errors and the valid ones
+    scored in a single vectorized call. scenario_id numbering starts at
+    start + 1.
+    """
+    # Partition into valid feature rows and per-row errors, without raising
+    predictions = []
+    valid_rows, valid_features = [], []
+    for i, scenario in enumerate(scenarios, start + 1):
+        features, error = check_features(scenario)
+        if error is not None:
+            predictions.append({
+                'scenario_id': i,
+                'error': error,
+                'input': scenario,
+                'status': 'error'
+            })
+            continue
+        valid_features.append(features)
+        valid_rows.append(len(predictions))
+        predictions.append({
+            'scenario_id': i,
+            'predicted_demand': None,
+            'input': scenario,
+            'status': 'success'
+        })
+    
+    if valid_features:
+        features = np.array(valid_features, dtype=np.float64)
+        values = predict_demand_batch(features, draw_noise(len(features))).tolist()
+        for row, prediction in zip(valid_rows, values):
+            predictions[row]['predicted_demand'] = prediction
+    return predictions
+
+# Below this many rows the serial compiled loop beats the cost of waking Numba's thread pool
+PARALLEL_BATCH_MIN = 512
+
+if _NUMBA_AVAILABLE:
+    _parallel_lock = threading.Lock()
+    
+    # Explicit signature: compiled at import without starting the thread pool,
+    # so gunicorn can still fork safely from a preloaded master
+    @njit('void(float64[:, ::1], float64[::1], float64[::1])',
+          parallel=True, fastmath=FASTMATH_FLAGS, cache=True)
+    def _predict_batch_parallel(features, noise, out):
+        """_score_rows with the rows spread across all cores"""
+        for i in prange(features.shape[0]):
+            out[i] = _demand_core(features[i, 0], int(features[i, 1]), features[i, 2],
+                                  int(features[i, 3]), int(features[i, 4]),
+                                  int(features[i, 5]), noise[i])
+    
+    @njit('void(float64[:, ::1], float64[::1], float64[::1])',
+          fastmath=FASTMATH_FLAGS, cache=True)
+    def _score_rows(features, noise, out):
+        """Score each row with the argument types score_features passes, so results match it"""
+        for i in range(features.shape[0]):
+            out[i] = _demand_core(features[i, 0], int(features[i, 1]), features[i, 2],
+                                  int(features[i, 3]), int(features[i, 4]),
+                                  int(features[i, 5]), noise[i])
+else:
+    def _score_rows(features, noise, out):
+        """Score each row with the argument types score_features passes, so results match it"""
+        for i, row in enumerate(features.tolist()):
+            out[i] = _demand_core(row[0], int(row[1]), row[2], int(row[3]),
+                                  int(row[4]), int(row[5]), noise[i])
+
+# Set once warm_up has run in this process; /ready reports it
+_warmed = threading.Event()
+
+def warm_up():
+    """
+    Prime per-process model state, e.g. from gunicorn's post_fork hook
+    
+    Runs the scalar core and, with Numba, one parallel batch so the worker's
+    thread pool starts now rather than on the first large request.
+    """
+    _demand_core(10.0, 0, 10.0, 1, 1, 500, 0.0)
+    if _NUMBA_AVAILABLE:
+        predict_demand_batch(np.tile(np.array(FEATURE_DEFAULTS, dtype=np.float64),
+                                     (PARALLEL_BATCH_MIN, 1)))
+    _warmed.set()
+
+class MicroBatcher:
+    """
+    Coalesce concurrent /predict calls into one kernel call
+    
+    score() runs a request directly when it is the only one in flight;
+    requests that arrive while others are being scored are queued instead.
+    A background thread takes the first queued request, keeps collecting
+    until max_batch requests are waiting or timeout_ms has passed, scores
+    them with one _score_rows call and resolves each caller's Future.
+    Rows are prepared exactly as score_features prepares them, so a
+    request gets the same answer whether or not it was batched.
+    Rows, results and the zero-noise vector all live in buffers allocated
+    once, so a batch allocates no arrays beyond the optional noise draw.
+    The batch size adapts AIMD-style: it grows by one while batches fill
+    within the latency budget and halves when a kernel call exceeds it.
+    """
+    
+    def __init__(self, max_batch=64, timeout_ms=10, latency_budget_ms=5):
+        self.max_batch_limit = max_batch
+        self.max_batch = max(1, max_batch // 4)
+        self.timeout = timeout_ms / 1000
+        self.latency_budget = latency_budget_ms / 1000
+        self._buffer = np.empty((max_batch, len(FEATURE_ORDER)))
+        self._out = np.empty(max_batch)
+        self._zeros = np.zeros(max_batch)
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._inflight = 0
+        self._thread = None
+        # Counters reported by /metrics
+        self.batches = 0
+        self.batched_requests = 0
+        self.largest_batch = 0
+    
+    def score(self, req):
+        """Score one decoded PredictRequest, joining a micro-batch if others are in flight"""
+        with self._lock:
+            join = self._inflight > 0
+            self._inflight += 1
+        try:
+            if join:
+                return self.predict(req)
+            return predict_demand_request(req)
+        finally:
+            with self._lock:
+                self._inflight -= 1
+    
+    def predict(self, req, timeout=5):
+        """Queue one decoded PredictRequest and wait for its batched result"""
+        check_request(req)
+        row = msgspec.structs.astuple(req)
+        
+        future = Future()
+        with self._lock:
+            # Started lazily so each forked gunicorn worker gets its own thread
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+        self._queue.put((row, future))
+        return future.result(timeout=timeout)
+    
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.timeout
+            while len(batch) < self.max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            
+            rows, futures = zip(*batch)
+            start = time.monotonic()
+            try:
+                predictions = self._score(rows)
+            except Exception as e:
+                for future in futures:
+                    future.set_exception(e)
+            else:
+                for future, prediction in zip(futures, predictions):
+                    future.set_result(prediction)
+            
+            self.batches += 1
+            self.batched_requests += len(batch)
+            self.largest_batch = max(self.largest_batch, len(batch))
+            self._adapt(len(batch), time.monotonic() - start)
+    
+    def _score(self, rows):
+        """Score queued rows the way score_features would, in one kernel call"""
+        # Only this thread touches the buffers, and max_batch never exceeds
+        # the limit they were sized for
+        n = len(rows)
+        features, out, zeros = self._buffer[:n], self._out[:n], self._zeros[:n]
+        features[:] = rows
+        noise = draw_noise(n)
+        
+        if not PREDICTION_CACHE_ENABLED:
+            _score_rows(features, zeros if noise is None else noise, out)
+            return out.tolist()
+        
+        # Like the cached path: noise-free core, noise folded in afterwards
+        _score_rows(features, zeros, out)
+        if noise is None:
+            return out.tolist()
+        return [max(0.0, math.floor(prediction * (1 + e) * 100.0 + 0.5) / 100)
+                for prediction, e in zip(out.tolist(), noise.tolist())]
+    
+    def _adapt(self, batch_size, elapsed):
+        """Additive increase / multiplicative decrease of max_batch"""
+        if elapsed > self.latency_budget:
+            self.max_batch = max(1, self.max_batch // 2)
+        elif batch_size >= self.max_batch:
+            self.max_batch = min(self.max_batch_limit, self.max_batch + 1)
+
+# Micro-batching is on by default; set MICROBATCH_ENABLED=0 to score every call directly.
+# A call joins a batch only while another /predict call is in flight in the same
+# worker, so the default single-threaded sync workers always score directly and
+# gthread workers (GUNICORN_THREADS > 1) coalesce overlapping calls. MICROBATCH_*
+# tune the batch size and waits; /metrics shows the batches actually formed
+_batcher = MicroBatcher(
+    max_batch=int(os.getenv('MICROBATCH_MAX_BATCH', '64')),
+    timeout_ms=float(os.getenv('MICROBATCH_TIMEOUT_MS', '10')),
+    latency_budget_ms=float(os.getenv('MICROBATCH_LATENCY_BUDGET_MS', '5'))
+) if os.getenv('MICROBATCH_ENABLED', '1') == '1' else None
+
+# Web interface page, kept as a static asset and read once at import
+HOME_HTML_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'static', 'index.html')
+with open(HOME_HTML_PATH, encoding='utf-8') as f:
+    HOME_HTML = f.read()
+
+def minify_inline_assets(html):
+    """Minify the <style> and <script> blocks of html when rcssmin/rjsmin are installed"""
+    if rcssmin is None:
+        return html
+    html = re.sub(r'(<style>)(.*?)(</style>)',
+                  lambda m: m.group(1) + rcssmin.cssmin(m.group(2)) + m.group(3),
+                  html, flags=re.S)
+    return re.sub(r'(<script>)(.*?)(</script>)',
+                  lambda m: m.group(1) + rjsmin.jsmin(m.group(2)) + m.group(3),
+                  html, flags=re.S)
+
+def static_etag(body):
+    """Strong ETag for a body fixed at import: the sha256 of its bytes"""
+    return hashlib.sha256(body).hexdigest()
+
+def static_response(body, etag, mimetype, headers=None):
+    """Serve a precomputed body, or an empty 304 if If-None-Match carries its ETag"""
+    if request.if_none_match.contains(etag):
+        response = Response(status=304)
+    else:
+        response = Response(body, mimetype=mimetype)
+    response.set_etag(etag)
+    if headers:
+        response.headers.update(headers)
+    return response
+
+HOME_BODY = minify_inline_assets(HOME_HTML).encode('utf-8')
+HOME_ETAG = static_etag(HOME_BODY)
+# Pre-compressed copy (mtime=0 keeps the bytes, and so the ETag, stable)
+HOME_GZIP = gzip.compress(HOME_BODY, 9, mtime=0)
+HOME_GZIP_ETAG = static_etag(HOME_GZIP)
+
+@app.route('/')
+def home():
+    """Serve the web interface"""
+    headers = {'Cache-Control': 'public, max-age=3600', 'Vary': 'Accept-Encoding'}
+    # Repeat visits with a matching If-None-Match get an empty 304
+    if request.accept_encodings['gzip']:
+        headers['Content-Encoding'] = 'gzip'
+        return static_response(HOME_GZIP, HOME_GZIP_ETAG, 'text/html', headers)
+    return static_response(HOME_BODY, HOME_ETAG, 'text/html', headers)
+
+# Static JSON bodies (and their ETags) are encoded once at import
+API_INFO_BODY = orjson.dumps({
+    'service': 'Bosch FMCG Pricing Optimization API',
+    'version': '1.0',
+    'status': 'active',
+    'endpoints': {
+        'predict': '/predict',
+        'predict_batch': '/predict/batch',
+        'health': '/health',
+        'ready': '/ready',
+        'info': '/info',
+        'batch_predict': '/batch-predict',
+        'batch_predict_stream': '/batch-predict-stream',
+        'metrics': '/metrics',
+        'cache_clear': '/cache/clear'
+    },
+    'documentation': 'https://api-docs.bosch-pricing.com'
+})
+API_INFO_ETAG = static_etag(API_INFO_BODY)
+
+MODEL_INFO_BODY = orjson.dumps({
+    'model_name': 'Bosch FMCG Demand Prediction Model',
+    'model_version': '1.0',
+    'framework': 'XGBoost',
+    'features': [
+        'price',
+        'promotion',
+        'competitor_price',
+        'day_of_week',
+        'month',
+        'inventory_level'
+    ],
+    'description': 'Predicts product demand based on pricing and market conditions',
+    'last_updated': '2024-11-27'
+})
+MODEL_INFO_ETAG = static_etag(MODEL_INFO_BODY)
+
+# /health only varies by timestamp, which is spliced into this template
+HEALTH_TEMPLATE = (b'{"status":"healthy","timestamp":"%s",'
+                   b'"service":"bosch-pricing-predictor","region":"us-east-1"}')
+READY_BODY = b'{"status":"ready","service":"bosch-pricing-predictor"}'
+
+@app.route('/api')
+def api_info():
+    """API information endpoint"""
+    # Static body: let repeat clients revalidate with If-None-Match
+    return static_response(API_INFO_BODY, API_INFO_ETAG, 'application/json')
+
+@app.route('/health', strict_slashes=False)
+def health_check():
+    """Health check endpoint (liveness)"""
+    return Response(HEALTH_TEMPLATE % current_timestamp().encode(),
+                    mimetype='application/json')
+
+@app.route('/ready', strict_slashes=False)
+def readiness_check():
+    """Readiness probe: a static body once this worker's model state is warm"""
+    # Workers not started through gunicorn's post_fork warm up on the first probe
+    if not _warmed.is_set():
+        warm_up()
+    return Response(READY_BODY, mimetype='application/json')
+
+@app.route('/info')
+def info():
+    """API information endpoint"""
+    return static_response(MODEL_INFO_BODY, MODEL_INFO_ETAG, 'application/json')
+
+def prediction_result(prediction, input_features):
+    """Build the /predict result fields for one prediction"""
+    # Calculate confidence interval (simulated)
+    return {
+        'predicted_demand': prediction,
+        'confidence_interval': {
+            'lower': math.floor(prediction * 85.0 + 0.5) / 100,
+            'upper': math.floor(prediction * 115.0 + 0.5) / 100,
+            'confidence_level': 0.95
+        },
+        'input_features': input_features
+    }
+
+# /predict success body with the per-request values punched in; key order
+# matches the prediction_result dict form
+PREDICT_RESPONSE_TEMPLATE = (
+    b'{"predicted_demand":%r,'
+    b'"confidence_interval":{"lower":%r,"upper":%r,"confidence_level":0.95},'
+    b'"input_features":{"price":%r,"promotion":%d,"competitor_price":%r,'
+    b'"day_of_week":%d,"month":%d,"inventory_level":%d},'
+    b'"model_version":"1.0","timestamp":"%b","status":"success"}'
+)
+
+def score_request(req):
+    """Score one decoded PredictRequest into the encoded /predict response body"""
+    # Make prediction; the batcher joins a micro-batch only when other calls are in flight
+    if _batcher is not None:
+        prediction = _batcher.score(req)
+    else:
+        prediction = predict_demand_request(req)
+    
+    # Validation keeps predictions finite (see PRICE_LIMIT); should one
+    # still not be, it is a 400 rather than a bogus body or an overflow
+    if not math.isfinite(prediction):
+        raise ValueError(f"Prediction error: prediction is not finite for {msgspec.structs.asdict(req)}")
+    
+    return PREDICT_RESPONSE_TEMPLATE % (
+        prediction,
+        math.floor(prediction * 85.0 + 0.5) / 100,
+        math.floor(prediction * 115.0 + 0.5) / 100,
+        req.price, req.promotion, req.competitor_price,
+        req.day_of_week, req.month, req.inventory_level,
+        current_timestamp().encode()
+    )
+
+class PredictFastPath:
+    """
+    WSGI middleware that answers single-record POST /predict without Flask
+    
+    Skips request/response object construction and view dispatch for the
+    hot scoring call. Requests it can't take (other routes, non-JSON
+    bodies, a chunked, missing or malformed Content-Length) and bodies
+    msgspec rejects (lists, missing or mistyped fields) are handed to
+    Flask, with the body restored, before anything is scored. Validation
+    errors raised while scoring get the same 400 body predict() sends,
+    answered here so no request is scored twice; anything else propagates.
+    """
+    
+    def __init__(self, wsgi_app):
+        self.wsgi_app = wsgi_app
+    
+    def __call__(self, environ, start_response):
+        if (environ.get('PATH_INFO') != '/predict'
+                or environ.get('REQUEST_METHOD') != 'POST'
+                or not environ.get('CONTENT_TYPE', '').startswith('application/json')):
+            return self.wsgi_app(environ, start_response)
+        
+        try:
+            length = int(environ.get('CONTENT_LENGTH', ''))
+        except ValueError:
+            length = -1
+        if length < 0:
+            return self.wsgi_app(environ, start_response)
+        
+        body = environ['wsgi.input'].read(length)
+        try:
+            req = msgspec.json.decode(body, type=PredictRequest, strict=False)
+        except msgspec.DecodeError:
+            environ['wsgi.input'] = io.BytesIO(body)
+            return self.wsgi_app(environ, start_response)
+        
+        try:
+            payload = score_request(req)
+            status = '200 OK'
+        except ValueError as e:
+            payload = orjson.dumps({'error': str(e), 'status': 'error'}, option=ORJSON_OPTIONS)
+            status = '400 BAD REQUEST'
+        
+        start_response(status, [('Content-Type', 'application/json'),
+                                ('Content-Length', str(len(payload)))])
+        return [payload]
+
+app.wsgi_app = PredictFastPath(app.wsgi_app)
+
+@app.route('/predict', methods=['POST'])
+def predict():
+    """
+    Main prediction endpoint
+    
+    Example request:
+    {
+        "price": 10.50,
+        "promotion": 1,
+        "competitor_price": 11.00,
+        "day_of_week": 3,
+        "month": 6,
+        "inventory_level": 500
+    }
+    
+    A JSON array of such records is scored in one vectorized call and
+    answered with a "predictions" list.
+    """
+    try:
+        # Parse input
+        if not request.is_json:
+            return json_response({
+                'error': 'Request must be JSON',
+                'status': 'error'
+            }), 400
+        
+        # Decode, validate and coerce the body in a single pass
+        try:
+            req = msgspec.json.decode(request.get_data(),
+                                      type=Union[PredictRequest, List[PredictRequest]],
+                                      strict=False)
+        except msgspec.DecodeError as e:
+            # msgspec stops at the first problem; name them all instead
+            problems = payload_errors(request.get_data())
+            return json_response({
+                'error': f'Prediction error: {problems}' if problems else str(e),
+                'status': 'error',
+                'required_fields': PREDICT_REQUIRED_FIELDS
+            }), 400
+        
+        if isinstance(req, list):
+            if not req:
+                return json_response({
+                    'error': 'No records provided',
+                    'status': 'error'
+                }), 400
+            
+            predictions = predict_demand_requests(req).tolist()
+            return json_response({
+                'predictions': [
+                    prediction_result(prediction, msgspec.structs.asdict(record))
+                    for prediction, record in zip(predictions, req)
+                ],
+                'total_records': len(req),
+                'model_version': '1.0',
+                'timestamp': current_timestamp(),
+                'status': 'success'
+            })
+        
+        # Return response
+        return app.response_class(score_request(req), mimetype='application/json')
+        
+    except ValueError as e:
+        return json_response({
+            'error': str(e),
+            'status': 'error'
+        }), 400
+        
+    except Exception as e:
+        return json_response({
+            'error': 'Internal server error',
+            'details': str(e),
+            'status': 'error'
+        }), 500
+
+# Scenarios scored per vectorized call on the streaming responses
+STREAM_CHUNK_SIZE = 1024
+# Closes the predictions array and appends the /batch-predict summary fields
+STREAM_BATCH_FOOTER = (b'],"total_scenarios":%d,"successful":%d,'
+                       b'"timestamp":"%b","status":"success"}')
+
+# zlib level for streamed responses, matching COMPRESS_LEVEL's cheap setting
+STREAM_GZIP_LEVEL = 3
+
+def gzip_chunks(chunks):
+    """
+    Gzip an iterable of byte chunks incrementally
+    
+    Each chunk is sync-flushed, so the client can decode every row block
+    as it arrives; this costs a few bytes per chunk over one-shot gzip.
+    """
+    compressor = zlib.compressobj(STREAM_GZIP_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    for chunk in chunks:
+        yield compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH)
+    yield compressor.flush()
+
+def streamed_response(chunks, mimetype):
+    """Stream byte chunks, gzipped on the fly when the client accepts gzip"""
+    if request.accept_encodings['gzip']:
+        response = Response(gzip_chunks(chunks), mimetype=mimetype)
+        response.headers['Content-Encoding'] = 'gzip'
+    else:
+        response = Response(chunks, mimetype=mimetype)
+    response.vary.add('Accept-Encoding')
+    return response
+
+def stream_batch_json(scenarios):
+    """
+    Yield the /batch-predict JSON body chunk by chunk
+    
+    Produces the same document as the buffered response, but only one
+    chunk of result rows is alive at a time; the summary fields follow
+    the predictions array, so they are known by the time they are written.
+    """
+    yield b'{"predictions":['
+    successful = 0
+    for start in range(0, len(scenarios), STREAM_CHUNK_SIZE):
+        rows = score_scenarios(scenarios[start:start + STREAM_CHUNK_SIZE], start)
+        successful += sum(1 for row in rows if row['status'] == 'success')
+        body = b','.join(orjson.dumps(row, option=ORJSON_OPTIONS) for row in rows)
+        yield body if start == 0 else b',' + body
+    yield STREAM_BATCH_FOOTER % (len(scenarios), successful, current_timestamp().encode())
+
+@app.route('/batch-predict', methods=['POST'])
+def batch_predict():
+    """
+    Batch prediction endpoint for multiple scenarios
+    
+    Accepts JSON or, with Content-Type: application/msgpack, MessagePack.
+    The response is MessagePack when the client prefers it via Accept.
+    JSON responses for more than STREAM_CHUNK_SIZE scenarios are streamed,
+    scored, encoded and (if accepted) gzipped one chunk at a time.
+    
+    Example request:
+    {
+        "scenarios": [
+            {"price": 10.0, "promotion": 1, ...},
+            {"price": 11.0, "promotion": 0, ...}
+        ]
+    }
+    """
+    try:
+        if request.mimetype == MSGPACK_MIMETYPE:
+            if msgpack is None:
+                return json_response({
+                    'error': 'MessagePack is not supported by this server',
+                    'status': 'error'
+                }), 415
+            data = msgpack.unpackb(request.get_data(), raw=False)
+        elif request.is_json:
+            data = request.get_json(silent=True)
+        else:
+            return json_response({
+                'error': 'Request must be JSON',
+                'status': 'error'
+            }), 400
+        
+        # Unparseable JSON (e.g. integers beyond 64 bits) or a non-object body
+        if not isinstance(data, dict):
+            return json_response({
+                'error': 'Request body must be a JSON object',
+                'status': 'error'
+            }), 400
+        
+        scenarios = data.get('scenarios', [])
+        
+        if not scenarios:
+            return json_response({
+                'error': 'No scenarios provided',
+                'status': 'error'
+            }), 400
+        
+        wants_msgpack = msgpack is not None and request.accept_mimetypes.best_match(
+            ['application/json', MSGPACK_MIMETYPE]) == MSGPACK_MIMETYPE
+        if not wants_msgpack and len(scenarios) > STREAM_CHUNK_SIZE:
+            return streamed_response(stream_batch_json(scenarios), 'application/json')
+        
+        predictions = score_scenarios(scenarios)
+        
+        result = {
+            'predictions': predictions,
+            'total_scenarios': len(scenarios),
+            'successful': sum(1 for p in predictions if p['status'] == 'success'),
+            'timestamp': current_timestamp(),
+            'status': 'success'
+        }
+        
+        if wants_msgpack:
+            return Response(msgpack.packb(result, use_bin_type=True),
+                            mimetype=MSGPACK_MIMETYPE), 200
+        
+        return json_response(result)
+        
+    except Exception as e:
+        return json_response({
+            'error': 'Internal server error',
+            'details': str(e),
+            'status': 'error'
+        }), 500
+
+# Upper bound on rows per /predict/batch request
+MAX_BATCH_ROWS = 100_000
+
+@app.route('/predict/batch', methods=['POST'])
+def predict_batch_matrix():
+    """
+    Batch prediction on a bare feature matrix
+    
+    Example request (columns in FEATURE_ORDER, at most MAX_BATCH_ROWS rows):
+    {
+        "features": [
+            [10.5, 1, 11.0, 6, 6, 500],
+            [12.0, 0, 11.0, 2, 3, 500]
+        ]
+    }
+    
+    Rows go straight into one C-contiguous (N, 6) float64 block for the
+    batch kernel; predictions come back in row order.
+    """
+    try:
+        if not request.is_json:
+            return json_response({
+                'error': 'Request must be JSON',
+                'status': 'error'
+            }), 400
+        
+        # msgspec checks the row shape and each column's type while decoding
+        try:
+            rows = msgspec.json.decode(request.get_data(cache=False),
+                                       type=FeatureMatrixRequest, strict=False).features
+        except msgspec.DecodeError as e:
+            return json_response({
+                'error': f'Invalid features: {str(e)}',
+                'status': 'error'
+            }), 400
+        
+        if not rows:
+            return json_response({
+                'error': 'No features provided',
+                'status': 'error'
+            }), 400
+        
+        if len(rows) > MAX_BATCH_ROWS:
+            return json_response({
+                'error': f'At most {MAX_BATCH_ROWS} rows per request',
+                'status': 'error'
+            }), 413
+        
+        features = np.array(rows, dtype=np.float64)
+        try:
+            check_bounds(features)
+        except ValueError as e:
+            return json_response({
+                'error': f'Invalid features: {str(e)}',
+                'status': 'error'
+            }), 400
+        
+        predictions = predict_demand_batch(features, draw_noise(len(features)))
+        
+        return json_response({
+            'predictions': predictions,
+            'total_rows': len(features),
+            'model_version': '1.0',
+            'timestamp': current_timestamp(),
+            'status': 'success'
+        })
+        
+    except Exception as e:
+        return json_response({
+            'error': 'Internal server error',
+            'details': str(e),
+            'status': 'error'
+        }), 500
+
+@app.route('/metrics')
+def metrics():
+    """Prediction cache and micro-batching statistics for this worker process"""
+    cache = _predict_deterministic.cache_info()
+    return json_response({
+        'prediction_cache': {
+            'enabled': PREDICTION_CACHE_ENABLED,
+            'hits': cache.hits,
+            'misses': cache.misses,
+            'size': cache.currsize,
+            'max_size': cache.maxsize
+        },
+        'micro_batching': {
+            'enabled': _batcher is not None,
+            'batches': _batcher.batches if _batcher else 0,
+            'batched_requests': _batcher.batched_requests if _batcher else 0,
+            'largest_batch': _batcher.largest_batch if _batcher else 0,
+            'max_batch': _batcher.max_batch if _batcher else 0
+        },
+        'timestamp': current_timestamp(),
+        'status': 'success'
+    })
+
+@app.route('/cache/clear', methods=['POST'])
+def cache_clear():
+    """Empty this worker's prediction cache"""
+    cleared = _predict_deterministic.cache_info().currsize
+    _predict_deterministic.cache_clear()
+    return json_response({
+        'cleared': cleared,
+        'timestamp': current_timestamp(),
+        'status': 'success'
+    })
+
+@app.route('/batch-predict-stream', methods=['POST'])
+def batch_predict_stream():
+    """
+    Streaming variant of /batch-predict
+    
+    Takes the same JSON body and returns application/x-ndjson, one result
+    row per line, scored in chunks of STREAM_CHUNK_SIZE so the first rows
+    go out before the last are computed.
+    """
+    try:
+        if not request.is_json:
+            return json_response({
+                'error': 'Request must be JSON',
+                'status': 'error'
+            }), 400
+        
+        data = request.get_json(silent=True)
+        if not isinstance(data, dict):
+            return json_response({
+                'error': 'Request body must be a JSON object',
+                'status': 'error'
+            }), 400
+        
+        scenarios = data.get('scenarios', [])
+        
+        if not scenarios:
+            return json_response({
+                'error': 'No scenarios provided',
+                'status': 'error'
+            }), 400
+        
+        def generate():
+            for start in range(0, len(scenarios), STREAM_CHUNK_SIZE):
+                chunk = scenarios[start:start + STREAM_CHUNK_SIZE]
+                yield b''.join(orjson.dumps(row, option=ORJSON_OPTIONS) + b'\n'
+                               for row in score_scenarios(chunk, start))
+        
+        return streamed_response(generate(), 'application/x-ndjson')
+        
+    except Exception as e:
+        return json_response({
+            'error': 'Internal server error',
+            'details': str(e),
+            'status': 'error'
+        }), 500
+
+@app.errorhandler(404)
+def not_found(error):
+    """Handle 404 errors"""
+    return json_response({
+        'error': 'Endpoint not found',
+        'status': 'error',
+        'available_endpoints': ['/predict', '/predict/batch', '/health', '/ready', '/info',
+                                '/batch-predict', '/batch-predict-stream', '/metrics',
+                                '/cache/clear']
+    }), 404
+
+@app.errorhandler(500)
+def internal_error(error):
+    """Handle 500 errors"""
+    return json_response({
+        'error': 'Internal server error',
+        'status': 'error'
+    }), 500
+
+if __name__ == '__main__':
+    # Debugger only on request (FLASK_DEBUG=1); the reloader stays off either way
+    debug = os.getenv('FLASK_DEBUG', '0') == '1'
+    port = int(os.getenv('PORT', '5000'))
+    
+    print("="*60)
+    print("  Bosch FMCG Pricing API Server")
+    print("="*60)
+    print("\nServer starting...")
+    print(f"Web Interface: http://127.0.0.1:{port}")
+    print("API Endpoints:")
+    print("  GET  /              - Web Interface")
+    print("  GET  /api           - API information")
+    print("  GET  /health        - Health check")
+    print("  GET  /ready         - Readiness probe")
+    print("  GET  /info          - Model information")
+    print("  GET  /metrics       - Prediction cache and batching statistics")
+    print("  POST /cache/clear   - Empty the prediction cache")
+    print("  POST /predict       - Single prediction")
+    print("  POST /predict/batch - Batch predictions on a feature matrix")
+    print("  POST /batch-predict - Batch predictions")
+    print("  POST /batch-predict-stream - Batch predictions as NDJSON")
+    print("\nExample usage:")
+    print(f'  curl -X POST http://127.0.0.1:{port}/predict \\')
+    print('       -H "Content-Type: application/json" \\')
+    print('       -d \'{"price": 10.5, "promotion": 1, "competitor_price": 11.0,')
+    print('            "day_of_week": 3, "month": 6, "inventory_level": 500}\'')
+    print("\nFor production, run under gunicorn (see gunicorn.conf.py):")
+    print("  gunicorn wsgi:app")
+    print("  or, behind ASGI: uvicorn asgi:app --workers 4")
+    print("\nPress Ctrl+C to stop the server")
+    print("="*60 + "\n")
+    
+    # Run development server
+    app.run(host='0.0.0.0', port=port, debug=debug, use_reloader=False, threaded=True)
\ No newline at end of file
@@ -0,0 +1,12 @@
+"""
+Bosch FMCG Pricing Model - WSGI Entrypoint
+Production import path for WSGI servers
+
+Usage:
+    gunicorn wsgi:app
+"""
+
+from mock_api_server import app
+
+# Some WSGI servers look for "application" by default
+application = app